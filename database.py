@@ -1,9 +1,16 @@
 """
 Minimal database module for OI Dashboard.
 Uses OI_TRACKER_DB_* env vars (load from .env).
+
+One-off schema setup (run once, outside the app):
+    python database.py --indexes --symbol-counts
 """
 
+import argparse
 import os
+import threading
+import weakref
+from contextlib import contextmanager
 
 try:
     from dotenv import load_dotenv
@@ -13,41 +20,257 @@ except ImportError:
     pass
 
 try:
-    import psycopg2  # noqa: F401
-    from psycopg2 import pool
+    import psycopg2
+    from psycopg2 import errors, pool
 
     POSTGRES_AVAILABLE = True
 except ImportError:
     POSTGRES_AVAILABLE = False
 
+try:
+    import asyncpg
+
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
 pg_pool = None
+_pool_lock = threading.Lock()
 
+if POSTGRES_AVAILABLE:
+
+    class BlockingConnectionPool(pool.ThreadedConnectionPool):
+        """
+        ThreadedConnectionPool whose getconn waits for a free connection (up to timeout
+        seconds) instead of raising PoolError as soon as maxconn connections are out.
+        """
+
+        def __init__(self, minconn, maxconn, *args, timeout: float = 30.0, **kwargs):
+            self._slots = threading.BoundedSemaphore(maxconn)
+            self._timeout = timeout
+            super().__init__(minconn, maxconn, *args, **kwargs)
+
+        def getconn(self, key=None):
+            if not self._slots.acquire(timeout=self._timeout):
+                raise pool.PoolError(f"no connection free after {self._timeout:g}s")
+            try:
+                return super().getconn(key)
+            except Exception:
+                self._slots.release()
+                raise
+
+        def putconn(self, conn=None, key=None, close=False):
+            # Only a connection handed out by getconn holds a slot. super().putconn raises
+            # PoolError for anything else (or on a closed pool); the slot comes back regardless
+            with self._lock:
+                checked_out = (key or self._rused.get(id(conn))) in self._used
+            try:
+                super().putconn(conn, key, close)
+            finally:
+                if checked_out:
+                    self._slots.release()
+
+
+def pool_max_size() -> int:
+    """Upper bound on pooled connections per process (OI_TRACKER_DB_POOL_MAX, default 32)."""
+    return int(os.getenv("OI_TRACKER_DB_POOL_MAX", "32"))
+
+
+# Names of the statements already PREPAREd on each pooled connection (prepared statements live
+# as long as the server session, so each connection prepares a statement once)
+_prepared = weakref.WeakKeyDictionary()
+
+# Trading days are IST days. Every session runs with this TimeZone (as does the rollup
+# trigger), so timestamp::date and naive range bounds name the same day on every path; it
+# changes nothing for timestamp without time zone columns.
+TRADE_TIMEZONE = "Asia/Kolkata"
+SESSION_OPTIONS = f"-c TimeZone={TRADE_TIMEZONE}"
+
+# Partial covering index for the bar queries: filter on (exchange, symbol, timestamp) and read
+# OHLC (plus volume/OI for the dashboard) straight from the index for the 1m/5m resolutions
+# the backtests and dashboard use.
+HOT_BARS_INDEX_SQL = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS mrb_hot
+    ON multi_resolution_bars (exchange, symbol, timestamp)
+    INCLUDE (open_price, high_price, low_price, close_price, volume, oi, resolution)
+    WHERE resolution IN ('1m', '1', '5m', '5', '1min', '5min', 'minute', 'MINUTE', 'ONE_MINUTE')
+"""
+# Covering index for the dashboard's ml_features range scan (feature_payload still comes
+# from the heap)
+ML_FEATURES_INDEX_SQL = """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS ml_features_exch_ts
+    ON ml_features (exchange, timestamp)
+    INCLUDE (itm_oi_ce_pct_change_3m_wavg, itm_oi_pe_pct_change_3m_wavg)
+"""
+INDEXES_SQL = {"mrb_hot": HOT_BARS_INDEX_SQL, "ml_features_exch_ts": ML_FEATURES_INDEX_SQL}
+
+# Per-day bar counts by (exchange, symbol, resolution), kept current by a statement-level
+# insert trigger on multi_resolution_bars, so symbol discovery sums a few rows per day
+# instead of counting every bar in the range. Deletes and updates are not tracked (re-run
+# the backfill to recount). Created by `python database.py --symbol-counts`.
+SYMBOL_COUNTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS daily_symbol_bar_count (
+        exchange text NOT NULL,
+        trade_date date NOT NULL,
+        symbol text NOT NULL,
+        resolution text NOT NULL,
+        bar_count bigint NOT NULL,
+        PRIMARY KEY (exchange, trade_date, symbol, resolution)
+    )
+"""
+SYMBOL_COUNTS_TRIGGER_SQL = f"""
+    CREATE OR REPLACE FUNCTION count_daily_symbol_bars() RETURNS trigger
+    LANGUAGE plpgsql SET TimeZone = '{TRADE_TIMEZONE}' AS $$
+    BEGIN
+        INSERT INTO daily_symbol_bar_count AS d
+            (exchange, trade_date, symbol, resolution, bar_count)
+        SELECT exchange, timestamp::date, symbol, resolution, COUNT(*)
+        FROM new_bars
+        WHERE exchange IS NOT NULL AND symbol IS NOT NULL AND resolution IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+        ON CONFLICT (exchange, trade_date, symbol, resolution)
+        DO UPDATE SET bar_count = d.bar_count + EXCLUDED.bar_count;
+        RETURN NULL;
+    END $$;
+    DROP TRIGGER IF EXISTS count_daily_symbol_bars ON multi_resolution_bars;
+    CREATE TRIGGER count_daily_symbol_bars
+        AFTER INSERT ON multi_resolution_bars
+        REFERENCING NEW TABLE AS new_bars
+        FOR EACH STATEMENT EXECUTE FUNCTION count_daily_symbol_bars();
+"""
+# Recount from the bars themselves (first install, or to repair drift after deletes) without
+# blocking ingest. The statement sees the bars and the rollup as of its snapshot; bars
+# committed after it reach the rollup only through the trigger. Writing
+# count - rollup-at-snapshot and adding it to the row's current value keeps those trigger
+# increments, so the result is exact however long the scan takes.
+SYMBOL_COUNTS_BACKFILL_SQL = """
+    INSERT INTO daily_symbol_bar_count AS d
+        (exchange, trade_date, symbol, resolution, bar_count)
+    SELECT b.exchange, b.trade_date, b.symbol, b.resolution, b.n - COALESCE(s.bar_count, 0)
+    FROM (
+        SELECT exchange, timestamp::date AS trade_date, symbol, resolution, COUNT(*) AS n
+        FROM multi_resolution_bars
+        WHERE exchange IS NOT NULL AND symbol IS NOT NULL AND resolution IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+    ) b
+    LEFT JOIN daily_symbol_bar_count s USING (exchange, trade_date, symbol, resolution)
+    ON CONFLICT (exchange, trade_date, symbol, resolution)
+    DO UPDATE SET bar_count = d.bar_count + EXCLUDED.bar_count
+"""
+
+
+def json_float_sql(column: str, key: str) -> str:
+    """
+    SQL expression for the top-level key of the JSON column as float8 (needs PostgreSQL 16 for
+    pg_input_is_valid). JSON numbers and numeric strings convert; text that is not valid JSON,
+    a non-object payload, a missing key or any other value gives NULL, so one bad row does not
+    fail the whole query. The nested CASE keeps Postgres from casting before the checks pass.
+    """
+    payload = f"{column}::jsonb"
+    text = f"({payload} ->> '{key}')"
+    return (
+        f"CASE WHEN pg_input_is_valid({column}::text, 'jsonb') THEN"
+        f" CASE WHEN jsonb_typeof({payload}) = 'object'"
+        f" AND jsonb_typeof({payload} -> '{key}') IN ('number', 'string')"
+        f" AND pg_input_is_valid({text}, 'float8')"
+        f" THEN {text}::float8 END"
+        " END"
+    )
 
-def get_db_connection():
-    """Create and return a database connection (PostgreSQL)."""
-    if not POSTGRES_AVAILABLE:
-        raise ImportError("psycopg2 is required. pip install psycopg2-binary")
 
+def _connect_params():
+    """Return PostgreSQL connection settings from OI_TRACKER_DB_* env vars."""
     db_type = (os.getenv("OI_TRACKER_DB_TYPE") or "postgres").lower()
     if db_type != "postgres":
         raise ValueError("Only PostgreSQL is supported. Set OI_TRACKER_DB_TYPE=postgres")
+    return {
+        "user": os.getenv("OI_TRACKER_DB_USER", "root"),
+        "password": os.getenv("OI_TRACKER_DB_PASSWORD", ""),
+        "host": os.getenv("OI_TRACKER_DB_HOST", "localhost"),
+        "port": int(os.getenv("OI_TRACKER_DB_PORT", "5432")),
+        "database": os.getenv("OI_TRACKER_DB_NAME", "oi_db_live"),
+    }
+
+
+def get_db_connection(read_only: bool = True):
+    """
+    Create and return a database connection (PostgreSQL).
+    read_only connections run in autocommit with read-only transactions, so SELECTs never
+    hold a snapshot open between calls; pass read_only=False to get a regular transaction.
+    """
+    if not POSTGRES_AVAILABLE:
+        raise ImportError("psycopg2 is required. pip install psycopg2-binary")
 
     global pg_pool
     if pg_pool is None:
-        pg_pool = pool.SimpleConnectionPool(
-            1,
-            50,
-            user=os.getenv("OI_TRACKER_DB_USER", "root"),
-            password=os.getenv("OI_TRACKER_DB_PASSWORD", ""),
-            host=os.getenv("OI_TRACKER_DB_HOST", "localhost"),
-            port=int(os.getenv("OI_TRACKER_DB_PORT", "5432")),
-            database=os.getenv("OI_TRACKER_DB_NAME", "oi_db_live"),
-        )
+        # Threaded pool: the dashboard serves requests from several threads at once; when all
+        # connections are out, callers wait for one rather than failing
+        with _pool_lock:
+            if pg_pool is None:
+                min_conn = int(os.getenv("OI_TRACKER_DB_POOL_MIN", "1"))
+                timeout = float(os.getenv("OI_TRACKER_DB_POOL_TIMEOUT", "30"))
+                pg_pool = BlockingConnectionPool(
+                    min_conn,
+                    pool_max_size(),
+                    timeout=timeout,
+                    options=SESSION_OPTIONS,
+                    **_connect_params(),
+                )
     conn = pg_pool.getconn()
-    conn.autocommit = False
+    if conn.autocommit != read_only or conn.readonly != read_only:
+        conn.set_session(readonly=read_only, autocommit=read_only)
     return conn
 
 
+def ensure_indexes(conn):
+    """Create the INDEXES_SQL indexes if missing. Failures (e.g. no DDL rights) are reported."""
+    readonly, autocommit = conn.readonly, conn.autocommit
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    conn.set_session(readonly=False, autocommit=True)
+    try:
+        for name, sql in INDEXES_SQL.items():
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql)
+            except psycopg2.Error as e:
+                print(f"Could not create index {name}: {e}")
+    finally:
+        conn.set_session(readonly=readonly, autocommit=autocommit)
+
+
+def ensure_symbol_counts(conn):
+    """
+    Create daily_symbol_bar_count, backfill it, then add its insert trigger and recount.
+    Each step commits on its own: a new table only becomes visible once filled, the scans
+    never lock multi_resolution_bars against inserts, and CREATE TRIGGER (which does) is a
+    short transaction; the second recount picks up bars inserted before the trigger existed.
+    Failures (e.g. no DDL rights) are reported, not raised.
+    """
+    readonly, autocommit = conn.readonly, conn.autocommit
+    conn.set_session(readonly=False, autocommit=False)
+    try:
+        with conn.cursor() as cur:
+            for step in (
+                (SYMBOL_COUNTS_TABLE_SQL, SYMBOL_COUNTS_BACKFILL_SQL),
+                (SYMBOL_COUNTS_TRIGGER_SQL,),
+                (SYMBOL_COUNTS_BACKFILL_SQL,),
+            ):
+                for sql in step:
+                    cur.execute(sql)
+                conn.commit()
+    except psycopg2.Error as e:
+        conn.rollback()
+        print(f"Could not create daily_symbol_bar_count: {e}")
+    finally:
+        conn.set_session(readonly=readonly, autocommit=autocommit)
+
+
+def has_table(cur, name: str) -> bool:
+    """True if a table or view called name is visible on the search path (checked on cur)."""
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (name,))
+    return cur.fetchone()[0]
+
+
 def release_db_connection(conn):
     """Release connection back to pool."""
     if pg_pool:
@@ -57,3 +280,95 @@ def release_db_connection(conn):
             conn.close()
         except Exception:
             pass
+
+
+@contextmanager
+def db_cursor(name=None, read_only: bool = True):
+    """
+    Yield a cursor on a pooled connection; commit on success, roll back on error, and always
+    return the connection to the pool. Pass name for a server-side (streaming) cursor; those
+    need a transaction, so they run on a regular (non-autocommit) connection.
+    """
+    conn = get_db_connection(read_only=read_only and name is None)
+    try:
+        with conn.cursor(name=name) as cur:
+            yield cur
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        release_db_connection(conn)
+
+
+def execute_prepared(cur, name: str, sql: str, params) -> None:
+    """
+    Run sql (written with $1, $2, ... placeholders) as the server-side prepared statement name.
+    The first call on a connection sends PREPARE; later calls only send EXECUTE, so Postgres
+    skips parsing and planning. Not usable with named (server-side) cursors.
+
+    If the session has lost its statements (DISCARD ALL, DEALLOCATE, a server-side
+    reconnect), the statement is prepared again and run once more; inside a transaction
+    (not autocommit) the error is raised instead, since the transaction is already aborted,
+    and the next call prepares afresh. Incompatible with pgbouncer transaction pooling, where
+    PREPARE and EXECUTE may reach different server sessions.
+    """
+    conn = cur.connection
+    names = _prepared.setdefault(conn, set())
+    if name not in names:
+        cur.execute(f"PREPARE {name} AS {sql}")
+        names.add(name)
+    execute = f"EXECUTE {name} ({', '.join(['%s'] * len(params))})"
+    try:
+        cur.execute(execute, params)
+    except errors.InvalidSqlStatementName:
+        names.clear()
+        if not conn.autocommit:
+            raise
+        cur.execute(f"PREPARE {name} AS {sql}")
+        names.add(name)
+        cur.execute(execute, params)
+
+
+async def create_async_pool(min_size: int = 2, max_size: int = 10):
+    """Create an asyncpg connection pool using the same OI_TRACKER_DB_* settings."""
+    if not ASYNCPG_AVAILABLE:
+        raise ImportError("asyncpg is required for async mode. pip install asyncpg")
+    return await asyncpg.create_pool(
+        min_size=min_size,
+        max_size=max_size,
+        server_settings={"TimeZone": TRADE_TIMEZONE},
+        **_connect_params(),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="One-off schema setup for the OI Dashboard (run once, not per worker)"
+    )
+    parser.add_argument(
+        "--indexes", action="store_true", help="Create the INDEXES_SQL indexes if missing"
+    )
+    parser.add_argument(
+        "--symbol-counts",
+        action="store_true",
+        help="Create daily_symbol_bar_count and its trigger, and (re)count it from the bars",
+    )
+    args = parser.parse_args()
+    if not (args.indexes or args.symbol_counts):
+        parser.error("nothing to do; pass --indexes and/or --symbol-counts")
+
+    if not POSTGRES_AVAILABLE:
+        raise ImportError("psycopg2 is required. pip install psycopg2-binary")
+    conn = psycopg2.connect(options=SESSION_OPTIONS, **_connect_params())
+    try:
+        if args.indexes:
+            ensure_indexes(conn)
+        if args.symbol_counts:
+            ensure_symbol_counts(conn)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
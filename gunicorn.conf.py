@@ -0,0 +1,21 @@
+"""
+Gunicorn settings for the dashboard (loaded automatically from the project root):
+    gunicorn oi_volume_dashboard:app
+Bind address comes from FLASK_HOST / FLASK_PORT, as with the development server.
+"""
+
+import os
+
+pythonpath = "scripts"
+bind = f"{os.getenv('FLASK_HOST', '127.0.0.1')}:{os.getenv('FLASK_PORT', '7000')}"
+# Threaded workers: psycopg2 blocks in C, so threads (not gevent greenlets) let one worker
+# wait on several queries at once. Each worker has its own DB pool and response cache.
+worker_class = "gthread"
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+# Every thread may be serving an /api/dashboard load, which runs three lookups at once on
+# separate pooled connections: size each worker's pool and lookup executor for that, unless
+# set explicitly (workers are forked from this process, so they inherit the environment)
+os.environ.setdefault("OI_TRACKER_DB_POOL_MAX", str(3 * threads))
+os.environ.setdefault("OI_DASHBOARD_WORKERS", str(3 * threads))
+timeout = 120
@@ -0,0 +1,198 @@
+"""
+Shared Numba helpers for the backtest scripts.
+
+Exposes njit / prange / NUMBA_AVAILABLE with pure-Python stand-ins when numba is not
+installed, plus the JIT-compiled OI/Vol entry/exit state machine (_simulate / _simulate_into).
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def trade_buffers(n):
+    """Empty (entry_idx, exit_idx, exit_price, pnl) arrays for up to n trades."""
+    return (
+        np.empty(n, dtype=np.int64),
+        np.empty(n, dtype=np.int64),
+        np.empty(n, dtype=np.float64),
+        np.empty(n, dtype=np.float64),
+    )
+
+
+@njit(cache=True)
+def _simulate_into_nb(
+    open_p, close_p, sig, hold_bars, min_gap, entry_idx, exit_idx, exit_price, pnl
+):
+    n = len(sig)
+    n_trades = 0
+    total = 0.0
+    position = 0
+    entry_bar = 0
+    entry_price = 0.0
+
+    for i in range(n):
+        s = sig[i]
+        if position != 0:
+            if s == -position or (hold_bars > 0 and i - entry_bar >= hold_bars):
+                p = open_p[i] - entry_price if position == 1 else entry_price - open_p[i]
+                entry_idx[n_trades] = entry_bar
+                exit_idx[n_trades] = i
+                exit_price[n_trades] = open_p[i]
+                pnl[n_trades] = p
+                total += p
+                n_trades += 1
+                position = 0
+        if position == 0 and s != 0 and i + min_gap < n:
+            position = s
+            entry_bar = i + 1
+            entry_price = open_p[i + 1]
+
+    if position != 0:
+        last_close = close_p[n - 1]
+        p = last_close - entry_price if position == 1 else entry_price - last_close
+        entry_idx[n_trades] = entry_bar
+        exit_idx[n_trades] = n - 1
+        exit_price[n_trades] = last_close
+        pnl[n_trades] = p
+        total += p
+        n_trades += 1
+
+    return total, n_trades
+
+
+@njit(cache=True)
+def _simulate_nb(open_p, close_p, sig, hold_bars, min_gap):
+    entry_idx, exit_idx, exit_price, pnl = trade_buffers(len(sig))
+    total, n_trades = _simulate_into_nb(
+        open_p, close_p, sig, hold_bars, min_gap, entry_idx, exit_idx, exit_price, pnl
+    )
+    return (
+        total,
+        n_trades,
+        entry_idx[:n_trades],
+        exit_idx[:n_trades],
+        exit_price[:n_trades],
+        pnl[:n_trades],
+    )
+
+
+def _simulate_py(open_p, close_p, sig, hold_bars, min_gap):
+    """Pure-Python twin of _simulate_nb, iterating plain lists instead of ndarray scalars."""
+    opens = open_p.tolist()
+    signals = sig.tolist()
+    n = len(signals)
+    entries: list = []
+    exits: list = []
+    exit_prices: list = []
+    pnls: list = []
+    total = 0.0
+    position = 0
+    entry_bar = 0
+    entry_price = 0.0
+
+    for i in range(n):
+        s = signals[i]
+        if position != 0:
+            if s == -position or (hold_bars > 0 and i - entry_bar >= hold_bars):
+                exit_price = opens[i]
+                p = exit_price - entry_price if position == 1 else entry_price - exit_price
+                entries.append(entry_bar)
+                exits.append(i)
+                exit_prices.append(exit_price)
+                pnls.append(p)
+                total += p
+                position = 0
+        if position == 0 and s != 0 and i + min_gap < n:
+            position = s
+            entry_bar = i + 1
+            entry_price = opens[i + 1]
+
+    if position != 0:
+        last_close = float(close_p[n - 1])
+        p = last_close - entry_price if position == 1 else entry_price - last_close
+        entries.append(entry_bar)
+        exits.append(n - 1)
+        exit_prices.append(last_close)
+        pnls.append(p)
+        total += p
+
+    return (
+        total,
+        len(pnls),
+        np.array(entries, dtype=np.int64),
+        np.array(exits, dtype=np.int64),
+        np.array(exit_prices, dtype=np.float64),
+        np.array(pnls, dtype=np.float64),
+    )
+
+
+def _simulate(
+    open_p: np.ndarray,
+    close_p: np.ndarray,
+    sig: np.ndarray,
+    hold_bars: int,
+    min_bars_after_signal: int = 1,
+) -> Tuple[float, int, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Entry/exit state machine for one day: enter at the next bar's open after a signal, exit at
+    the open after hold_bars or on the opposite signal, mark an open position to the last close.
+    Returns (total_pnl, num_trades, entry_idx, exit_idx, exit_price, pnl) as parallel arrays;
+    a trade's side is the signal on the bar before its entry.
+    """
+    min_gap = max(min_bars_after_signal, 1)
+    if NUMBA_AVAILABLE:
+        return _simulate_nb(
+            np.ascontiguousarray(open_p, dtype=np.float64),
+            np.ascontiguousarray(close_p, dtype=np.float64),
+            np.ascontiguousarray(sig, dtype=np.int8),
+            hold_bars,
+            min_gap,
+        )
+    return _simulate_py(open_p, close_p, sig, hold_bars, min_gap)
+
+
+def _simulate_into(
+    open_p: np.ndarray,
+    close_p: np.ndarray,
+    sig: np.ndarray,
+    hold_bars: int,
+    out: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    min_bars_after_signal: int = 1,
+) -> Tuple[float, int]:
+    """
+    _simulate writing its trades into out = trade_buffers(m), m >= len(sig), instead of fresh
+    arrays; returns (total_pnl, num_trades) and trade i is row i of each out array. Reusing
+    out across calls keeps a grid search from allocating per day and combo.
+    """
+    min_gap = max(min_bars_after_signal, 1)
+    if NUMBA_AVAILABLE:
+        return _simulate_into_nb(
+            np.ascontiguousarray(open_p, dtype=np.float64),
+            np.ascontiguousarray(close_p, dtype=np.float64),
+            np.ascontiguousarray(sig, dtype=np.int8),
+            hold_bars,
+            min_gap,
+            *out,
+        )
+    total, n_trades, *trades = _simulate_py(open_p, close_p, sig, hold_bars, min_gap)
+    for buf, values in zip(out, trades):
+        buf[:n_trades] = values
+    return total, n_trades
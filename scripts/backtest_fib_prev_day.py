@@ -14,19 +14,31 @@ Usage (from project root):
 from __future__ import annotations
 
 import argparse
+import asyncio
+import io
+import itertools
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import database as db  # noqa: E402
+from scripts._backtest_njit import NUMBA_AVAILABLE, njit, prange  # noqa: E402
 
 # Resolutions for bars (1m or 5m)
 RES_VARIANTS = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE", "5", "5m", "5min")
+# Inlined as a literal IN list: RES_VARIANTS is constant, so there is nothing to bind per call
+RES_IN_SQL = "resolution IN (" + ", ".join(f"'{r}'" for r in RES_VARIANTS) + ")"
 
 # Month name -> substring to match in symbol (DEC future for Dec, etc.)
 MONTH_SYMBOL_HINT = {
@@ -44,24 +56,121 @@ MONTH_SYMBOL_HINT = {
     12: "DEC",
 }
 
+# Day record used by the backtest:
+# (date, symbol, prev_high, prev_low, fib_levels_array, open, high, low, close)
+DayData = Tuple[date, str, float, float, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# One day's bars as float64 column arrays: (open, high, low, close)
+BarArrays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+# Days packed into flat arrays for the JIT driver: (offsets, open, high, low, close, fib)
+# Day i owns bars offsets[i]:offsets[i + 1]; fib has one fib_level_array row per day.
+PackedDays = Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
 
-def get_latest_date_in_db(exchange: str, start_dt: datetime) -> Optional[date]:
-    """Return latest date with bars in DB for exchange (on or after start_dt)."""
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT DATE(MAX(timestamp)) AS last_date
+# Queries shared by the psycopg2 (sync) and asyncpg (--async) loaders
+COVERAGE_SQL = f"""
+    SELECT symbol,
+           DATE(MIN(timestamp)) AS first_date,
+           DATE(MAX(timestamp)) AS last_date,
+           COUNT(*) AS bar_count
+    FROM multi_resolution_bars
+    WHERE exchange = %s
+      AND timestamp >= %s
+      AND timestamp < %s
+      AND {RES_IN_SQL}
+      AND symbol IS NOT NULL
+    GROUP BY symbol
+    ORDER BY bar_count DESC
+"""
+
+# Bulk bars are pulled with COPY ... (FORMAT BINARY). Every column is fixed-width and
+# non-null (symbol as its 1-based position in the symbol list, missing prices as NaN),
+# so each tuple is one BARS_COPY_DTYPE record and the payload maps straight onto NumPy.
+# One scan of the window yields both parts: the trade-day bars (rows with open and close)
+# and, aggregated in Postgres, one high/low row per (symbol, date) over the rows with high
+# and low (open/close NaN). Each day's H/L row sorts ahead of its bars.
+# Params: symbols, exchange, symbols, window start, window end, first trade day, last H/L day
+BARS_BULK_SQL = f"""
+    WITH w AS (
+        SELECT array_position(%s::text[], symbol)::int4 AS sym, timestamp,
+               open_price, high_price, low_price, close_price
         FROM multi_resolution_bars
-        WHERE exchange = %s
-          AND timestamp >= %s
-          AND resolution = ANY(%s)
-        """,
-        (exchange, start_dt, list(RES_VARIANTS)),
+        WHERE exchange = %s AND symbol = ANY(%s)
+          AND timestamp >= %s AND timestamp < %s
+          AND {RES_IN_SQL}
     )
-    row = cur.fetchone()
-    db.release_db_connection(conn)
-    return row[0] if row and row[0] else None
+    SELECT sym, day, open_price, high_price, low_price, close_price
+    FROM (
+        SELECT sym, timestamp::date AS day, timestamp,
+               open_price::float8,
+               COALESCE(high_price::float8, 'NaN') AS high_price,
+               COALESCE(low_price::float8, 'NaN') AS low_price,
+               close_price::float8
+        FROM w
+        WHERE timestamp >= %s AND open_price IS NOT NULL AND close_price IS NOT NULL
+        UNION ALL
+        SELECT sym, timestamp::date, NULL, 'NaN', MAX(high_price)::float8,
+               MIN(low_price)::float8, 'NaN'
+        FROM w
+        WHERE timestamp < %s AND high_price IS NOT NULL AND low_price IS NOT NULL
+        GROUP BY 1, 2
+    ) rows
+    ORDER BY sym, day, timestamp NULLS FIRST
+"""
+
+COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00"
+BARS_COPY_DTYPE = np.dtype(
+    [
+        ("nfields", ">i2"),
+        ("sym_len", ">i4"),
+        ("sym", ">i4"),
+        ("day_len", ">i4"),
+        ("day", ">i4"),
+        ("open_len", ">i4"),
+        ("open", ">f8"),
+        ("high_len", ">i4"),
+        ("high", ">f8"),
+        ("low_len", ">i4"),
+        ("low", ">f8"),
+        ("close_len", ">i4"),
+        ("close", ">f8"),
+    ]
+)
+# Byte length every BARS_COPY_DTYPE field must carry (-1 would be a NULL)
+BARS_COPY_FIELD_LENS = {
+    "sym_len": 4,
+    "day_len": 4,
+    "open_len": 8,
+    "high_len": 8,
+    "low_len": 8,
+    "close_len": 8,
+}
+COPY_TRAILER = b"\xff\xff"
+PG_EPOCH_ORDINAL = date(2000, 1, 1).toordinal()  # COPY BINARY dates count days from here
+
+
+def _asyncpg_sql(sql: str) -> str:
+    """Rewrite psycopg2 %s placeholders as asyncpg $1..$n."""
+    parts = sql.split("%s")
+    return "".join(f"{part}${i}" for i, part in enumerate(parts[:-1], 1)) + parts[-1]
+
+
+def get_latest_dates_in_db(exchanges: List[str], start_dt: datetime) -> Dict[str, date]:
+    """Return {exchange: latest date with bars on or after start_dt}, in one grouped query."""
+    with db.db_cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT exchange, DATE(MAX(timestamp)) AS last_date
+            FROM multi_resolution_bars
+            WHERE exchange = ANY(%s)
+              AND timestamp >= %s
+              AND {RES_IN_SQL}
+            GROUP BY exchange
+            """,
+            (list(exchanges), start_dt),
+        )
+        rows = cur.fetchall()
+    return {row[0]: row[1] for row in rows if row[1]}
 
 
 def get_symbols_with_coverage(
@@ -70,47 +179,34 @@ def get_symbols_with_coverage(
     end_dt: datetime,
 ) -> List[Tuple[str, date, date, int]]:
     """Return list of (symbol, first_date, last_date, bar_count) for exchange in range."""
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT symbol,
-               DATE(MIN(timestamp)) AS first_date,
-               DATE(MAX(timestamp)) AS last_date,
-               COUNT(*) AS bar_count
-        FROM multi_resolution_bars
-        WHERE exchange = %s
-          AND timestamp >= %s
-          AND timestamp < %s
-          AND resolution = ANY(%s)
-          AND symbol IS NOT NULL
-        GROUP BY symbol
-        ORDER BY bar_count DESC
-        """,
-        (exchange, start_dt, end_dt, list(RES_VARIANTS)),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
+    with db.db_cursor() as cur:
+        cur.execute(COVERAGE_SQL, (exchange, start_dt, end_dt))
+        rows = cur.fetchall()
     return [(row[0], row[1], row[2], row[3]) for row in rows if row[1] and row[2]]
 
 
-def pick_symbol_for_date(
-    exchange: str,
+def _month_hint_flags(month: int, symbols_upper: List[str]) -> List[bool]:
+    """For each upper-cased symbol, whether it names the futures month (e.g. DEC)."""
+    month_hint = MONTH_SYMBOL_HINT.get(month, "")
+    return [bool(month_hint) and month_hint in sym for sym in symbols_upper]
+
+
+def _pick_from_coverage(
     trade_date: date,
     symbols_with_coverage: List[Tuple[str, date, date, int]],
+    hint_flags: List[bool],
 ) -> Optional[str]:
     """
-    Pick futures symbol for trade_date: December -> DEC future, January -> JAN future, etc.
-    If no month-specific futures symbol has data on trade_date, use symbol with most bars in range.
+    Pick the futures symbol for trade_date: December -> DEC future, January -> JAN future, etc.
+    (hint_flags from _month_hint_flags). If no month-specific symbol has data on trade_date,
+    use the symbol with the most bars in range.
     """
-    month_hint = MONTH_SYMBOL_HINT.get(trade_date.month, "")
     candidates = []
     fallback = None
-    for symbol, first_d, last_d, bar_count in symbols_with_coverage:
+    for (symbol, first_d, last_d, bar_count), is_month in zip(symbols_with_coverage, hint_flags):
         if not (first_d <= trade_date <= last_d):
             continue
-        sym_upper = symbol.upper()
-        if month_hint and month_hint in sym_upper:
+        if is_month:
             candidates.append((symbol, bar_count))
         if fallback is None or bar_count > (fallback[1] if fallback else 0):
             fallback = (symbol, bar_count)
@@ -120,73 +216,6 @@ def pick_symbol_for_date(
     return fallback[0] if fallback else None
 
 
-def get_prev_day_high_low(
-    exchange: str,
-    symbol: str,
-    trade_date: date,
-) -> Optional[Tuple[float, float]]:
-    """Return (high, low) for previous trading day for symbol."""
-    prev = trade_date - timedelta(days=1)
-    start_dt = datetime.combine(prev, datetime.min.time())
-    end_dt = datetime.combine(prev + timedelta(days=1), datetime.min.time())
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT high_price, low_price
-        FROM multi_resolution_bars
-        WHERE exchange = %s AND symbol = %s
-          AND timestamp >= %s AND timestamp < %s
-          AND resolution = ANY(%s)
-        """,
-        (exchange, symbol, start_dt, end_dt, list(RES_VARIANTS)),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-    valid = [r for r in rows if r[0] is not None and r[1] is not None]
-    if not valid:
-        return None
-    high = max(float(r[0]) for r in valid)
-    low = min(float(r[1]) for r in valid)
-    return (high, low)
-
-
-def get_bars_for_day(
-    exchange: str,
-    symbol: str,
-    trade_date: date,
-) -> List[Dict[str, Any]]:
-    """Return list of bars (timestamp, open, high, low, close) for trade_date."""
-    start_dt = datetime.combine(trade_date, datetime.min.time())
-    end_dt = datetime.combine(trade_date + timedelta(days=1), datetime.min.time())
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT timestamp, open_price, high_price, low_price, close_price
-        FROM multi_resolution_bars
-        WHERE exchange = %s AND symbol = %s
-          AND timestamp >= %s AND timestamp < %s
-          AND resolution = ANY(%s)
-        ORDER BY timestamp
-        """,
-        (exchange, symbol, start_dt, end_dt, list(RES_VARIANTS)),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-    return [
-        {
-            "ts": row[0],
-            "open": float(row[1]) if row[1] is not None else None,
-            "high": float(row[2]) if row[2] is not None else None,
-            "low": float(row[3]) if row[3] is not None else None,
-            "close": float(row[4]) if row[4] is not None else None,
-        }
-        for row in rows
-        if row[1] is not None and row[4] is not None
-    ]
-
-
 def fib_levels(high: float, low: float) -> Dict[str, float]:
     """Compute key Fib levels. Low=0, High=1."""
     r = high - low
@@ -213,10 +242,39 @@ TARGET_EXT_KEYS = {
     1.272: ("ext_1272_above", "ext_1272_below"),
 }
 
+# Per-day Fib levels are precomputed into an array in this order (see fib_level_array)
+FIB_KEYS = (
+    "low",
+    "high",
+    "range",
+    "ret_382",
+    "ret_5",
+    "ret_618",
+    "ret_786",
+    "ext_111_above",
+    "ext_111_below",
+    "ext_1272_above",
+    "ext_1272_below",
+)
+FIB_INDEX = {key: i for i, key in enumerate(FIB_KEYS)}
+ENTRY_RATIO_INDEX = {ratio: FIB_INDEX[key] for ratio, key in ENTRY_RATIO_KEYS.items()}
+TARGET_EXT_INDEX = {
+    ratio: (FIB_INDEX[above], FIB_INDEX[below]) for ratio, (above, below) in TARGET_EXT_KEYS.items()
+}
+
+
+def fib_level_array(high: float, low: float) -> np.ndarray:
+    """Return fib_levels(high, low) as a float64 array ordered by FIB_KEYS."""
+    fib = fib_levels(high, low)
+    return np.array([fib[key] for key in FIB_KEYS], dtype=np.float64)
+
 
 def run_fib_day(
-    bars: List[Dict[str, Any]],
-    fib: Dict[str, float],
+    open_a: np.ndarray,
+    high_a: np.ndarray,
+    low_a: np.ndarray,
+    close_a: np.ndarray,
+    fib: np.ndarray,
     stop_buffer_pts: float = 15.0,
     entry_ratio: float = 0.618,
     target_ext_ratio: float = 1.11,
@@ -225,68 +283,325 @@ def run_fib_day(
     """
     One trade per day: first touch of entry_level + bounce = long, rejection = short.
     entry_ratio: 0.382, 0.5, 0.618, 0.786. target_ext_ratio: 1.11 or 1.272. sides: both, long_only, short_only.
+    Bars are OHLC arrays and fib is the day's fib_level_array; entry and exit bars are found
+    with vectorized masks (stop wins ties).
     Returns (pnl_points, side, note).
     """
-    if not bars or fib["range"] <= 0:
+    if len(close_a) == 0 or fib[FIB_INDEX["range"]] <= 0:
         return 0.0, None, "no_bars_or_range"
-    ret_key = ENTRY_RATIO_KEYS.get(entry_ratio, "ret_618")
-    ret_level = fib[ret_key]
-    ext_keys = TARGET_EXT_KEYS.get(target_ext_ratio, ("ext_111_above", "ext_111_below"))
-    ext_above = fib[ext_keys[0]]
-    ext_below = fib[ext_keys[1]]
-    prev_high = fib["high"]
-    prev_low = fib["low"]
+    allow_long = sides in ("both", "long_only")
+    allow_short = sides in ("both", "short_only")
+    if not (allow_long or allow_short):
+        return 0.0, None, "no_setup"
+    ret_level = fib[ENTRY_RATIO_INDEX.get(entry_ratio, FIB_INDEX["ret_618"])]
+    above_idx, below_idx = TARGET_EXT_INDEX.get(target_ext_ratio, TARGET_EXT_INDEX[1.11])
+    ext_above = fib[above_idx]
+    ext_below = fib[below_idx]
+    prev_high = fib[FIB_INDEX["high"]]
+    prev_low = fib[FIB_INDEX["low"]]
     stop_long = ret_level - stop_buffer_pts
     stop_short = ret_level + stop_buffer_pts
 
-    entry_price: Optional[float] = None
-    side: Optional[str] = None
-    target: Optional[float] = None
+    long_trigger = (low_a <= ret_level) & (close_a > open_a) & (close_a > ret_level)
+    short_trigger = (high_a >= ret_level) & (close_a < open_a) & (close_a < ret_level)
+    if not allow_long:
+        long_trigger[:] = False
+    if not allow_short:
+        short_trigger[:] = False
+    trigger = long_trigger | short_trigger
+    if not trigger.any():
+        return 0.0, None, "no_setup"
+
+    i = int(trigger.argmax())
+    entry_price = float(close_a[i])
+    after_high = high_a[i + 1 :]
+    after_low = low_a[i + 1 :]
+    if long_trigger[i]:
+        target = min(ext_above, prev_high + 1)
+        stop_hit = after_low <= stop_long
+        exit_hit = stop_hit | (after_high >= target)
+        if exit_hit.any():
+            if stop_hit[exit_hit.argmax()]:
+                return float(stop_long - entry_price), "long", "stop"
+            return float(target - entry_price), "long", "target"
+        return float(close_a[-1]) - entry_price, "long", "eod"
+
+    target = max(ext_below, prev_low - 1)
+    stop_hit = after_high >= stop_short
+    exit_hit = stop_hit | (after_low <= target)
+    if exit_hit.any():
+        if stop_hit[exit_hit.argmax()]:
+            return float(entry_price - stop_short), "short", "stop"
+        return float(entry_price - target), "short", "target"
+    return entry_price - float(close_a[-1]), "short", "eod"
 
-    for i, b in enumerate(bars):
-        o, h, low, c = b["open"], b["high"], b["low"], b["close"]
-        if o is None or c is None:
-            continue
-        if side is not None:
-            if side == "long":
-                if low <= stop_long:
-                    return stop_long - entry_price, "long", "stop"
-                if h >= target:
-                    return target - entry_price, "long", "target"
-            else:
-                if h >= stop_short:
-                    return entry_price - stop_short, "short", "stop"
-                if low <= target:
-                    return entry_price - target, "short", "target"
-            continue
 
-        allow_long = sides in ("both", "long_only")
-        allow_short = sides in ("both", "short_only")
-        if allow_long and low <= ret_level and c > o and c > ret_level:
+# Exit reasons returned by _run_fib_day_nb
+EXIT_NO_SETUP, EXIT_STOP, EXIT_TARGET, EXIT_EOD = 0, 1, 2, 3
+_FIB_LOW = FIB_INDEX["low"]
+_FIB_HIGH = FIB_INDEX["high"]
+_FIB_RANGE = FIB_INDEX["range"]
+
+
+@njit(cache=True)
+def _run_fib_day_nb(
+    open_a,
+    high_a,
+    low_a,
+    close_a,
+    ret_level,
+    stop_long,
+    stop_short,
+    target_long,
+    target_short,
+    allow_long,
+    allow_short,
+):
+    """
+    Bar-walking kernel of run_fib_day (compiled by numba when available).
+    Returns (pnl_points, side, exit) with side 1 = long, -1 = short, 0 = no trade.
+    """
+    n = close_a.shape[0]
+    if not (allow_long or allow_short):
+        return 0.0, 0, EXIT_NO_SETUP
+    side = 0
+    entry_price = 0.0
+    for i in range(n):
+        o = open_a[i]
+        h = high_a[i]
+        low = low_a[i]
+        c = close_a[i]
+        if side == 1:
+            if low <= stop_long:
+                return stop_long - entry_price, 1, EXIT_STOP
+            if h >= target_long:
+                return target_long - entry_price, 1, EXIT_TARGET
+        elif side == -1:
+            if h >= stop_short:
+                return entry_price - stop_short, -1, EXIT_STOP
+            if low <= target_short:
+                return entry_price - target_short, -1, EXIT_TARGET
+        elif allow_long and low <= ret_level and c > o and c > ret_level:
+            side = 1
             entry_price = c
-            side = "long"
-            target = min(ext_above, prev_high + 1)
-            continue
-        if allow_short and h >= ret_level and c < o and c < ret_level:
+        elif allow_short and h >= ret_level and c < o and c < ret_level:
+            side = -1
             entry_price = c
-            side = "short"
-            target = max(ext_below, prev_low - 1)
+    if side == 1:
+        return close_a[n - 1] - entry_price, 1, EXIT_EOD
+    if side == -1:
+        return entry_price - close_a[n - 1], -1, EXIT_EOD
+    return 0.0, 0, EXIT_NO_SETUP
+
+
+@njit(cache=True, parallel=True)
+def run_all_days_nb(
+    offsets,
+    open_a,
+    high_a,
+    low_a,
+    close_a,
+    fib,
+    ret_idx,
+    above_idx,
+    below_idx,
+    stop_buffer,
+    allow_long,
+    allow_short,
+):
+    """
+    Run one parameter combo over all packed days (prange over days).
+    Returns (pnl, side) arrays with one entry per day.
+    """
+    n_days = offsets.shape[0] - 1
+    pnl = np.zeros(n_days)
+    side = np.zeros(n_days, dtype=np.int8)
+    for d in prange(n_days):
+        lo = offsets[d]
+        hi = offsets[d + 1]
+        if hi == lo or fib[d, _FIB_RANGE] <= 0:
             continue
+        ret_level = fib[d, ret_idx]
+        day_pnl, day_side, _ = _run_fib_day_nb(
+            open_a[lo:hi],
+            high_a[lo:hi],
+            low_a[lo:hi],
+            close_a[lo:hi],
+            ret_level,
+            ret_level - stop_buffer,
+            ret_level + stop_buffer,
+            min(fib[d, above_idx], fib[d, _FIB_HIGH] + 1),
+            max(fib[d, below_idx], fib[d, _FIB_LOW] - 1),
+            allow_long,
+            allow_short,
+        )
+        pnl[d] = day_pnl
+        side[d] = day_side
+    return pnl, side
+
+
+def pack_days(days_data: List[DayData]) -> PackedDays:
+    """Concatenate per-day OHLC arrays into flat arrays plus day offsets for run_all_days_nb."""
+    lengths = [len(day[8]) for day in days_data]
+    offsets = np.zeros(len(days_data) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return (
+        offsets,
+        np.concatenate([day[5] for day in days_data]),
+        np.concatenate([day[6] for day in days_data]),
+        np.concatenate([day[7] for day in days_data]),
+        np.concatenate([day[8] for day in days_data]),
+        np.vstack([day[4] for day in days_data]),
+    )
+
+
+# (symbol, date) -> (high, low) and (symbol, date) -> OHLC arrays
+DailyHL = Dict[Tuple[str, date], Tuple[float, float]]
+BarsByDay = Dict[Tuple[str, date], BarArrays]
+
+
+def _parse_bars_copy(buf: Any, symbols: List[str]) -> Tuple[DailyHL, BarsByDay]:
+    """
+    Split a binary COPY of BARS_BULK_SQL into per-(symbol, date) high/low and float64 OHLC
+    column arrays. Rows arrive ordered by symbol, date and timestamp, so each day is one
+    contiguous run: its H/L row (NaN open) if any, then its bars.
+    """
+    data = memoryview(buf)
+    if bytes(data[: len(COPY_SIGNATURE)]) != COPY_SIGNATURE:
+        raise ValueError("Unexpected COPY BINARY header")
+    ext_len = int.from_bytes(data[15:19], "big")
+    header_len = 19 + ext_len
+    # Anything but whole fixed-width records (a NULL, a column type that is not float8, ...)
+    # would otherwise be decoded as garbage prices
+    body_len = len(data) - header_len - len(COPY_TRAILER)
+    if body_len < 0 or bytes(data[-len(COPY_TRAILER) :]) != COPY_TRAILER:
+        raise ValueError("Unexpected COPY BINARY trailer")
+    n_rows, extra = divmod(body_len, BARS_COPY_DTYPE.itemsize)
+    if extra:
+        raise ValueError(f"COPY BINARY body is not whole {BARS_COPY_DTYPE.itemsize}-byte rows")
+    rec = np.frombuffer(data, dtype=BARS_COPY_DTYPE, count=n_rows, offset=header_len)
+    if n_rows == 0:
+        return {}, {}
+    if not (rec["nfields"] == len(BARS_COPY_FIELD_LENS)).all() or any(
+        not (rec[name] == size).all() for name, size in BARS_COPY_FIELD_LENS.items()
+    ):
+        raise ValueError("Unexpected COPY BINARY row layout (NULL or non-float8 field)")
+
+    open_a, high_a, low_a, close_a = (
+        rec[name].astype(np.float64) for name in ("open", "high", "low", "close")
+    )
+    is_hl = np.isnan(open_a)
+    sym = rec["sym"]
+    day = rec["day"]
+    starts = np.flatnonzero((sym[1:] != sym[:-1]) | (day[1:] != day[:-1])) + 1
+    bounds = [0, *starts.tolist(), n_rows]
+    hl_by_day: DailyHL = {}
+    bars_by_day: BarsByDay = {}
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        key = (symbols[int(sym[lo]) - 1], date.fromordinal(PG_EPOCH_ORDINAL + int(day[lo])))
+        if is_hl[lo]:
+            hl_by_day[key] = (float(high_a[lo]), float(low_a[lo]))
+            lo += 1
+        if lo < hi:
+            bars_by_day[key] = (open_a[lo:hi], high_a[lo:hi], low_a[lo:hi], close_a[lo:hi])
+    return hl_by_day, bars_by_day
+
+
+def load_bars_bulk(
+    exchange: str,
+    symbols: List[str],
+    start_date: date,
+    end_date: date,
+) -> Tuple[DailyHL, BarsByDay]:
+    """
+    Fetch bars for all symbols from start_date through end_date, plus the daily high/low of
+    each day before one of them, with a single binary COPY, so rows are never turned into
+    Python objects. Returns (daily high/low, OHLC column arrays), both keyed by (symbol, date).
+    """
+    symbols = list(symbols)
+    buf = io.BytesIO()
+    with db.db_cursor() as cur:
+        query = cur.mogrify(BARS_BULK_SQL, _bulk_params(exchange, symbols, start_date, end_date))
+        cur.copy_expert(f"COPY ({query.decode()}) TO STDOUT WITH (FORMAT BINARY)", buf)
+    return _parse_bars_copy(buf.getbuffer(), symbols)
+
+
+def _pick_days(
+    exchange: str,
+    start_date: date,
+    end_date: date,
+    symbols_with_coverage: List[Tuple[str, date, date, int]],
+) -> List[Tuple[date, str]]:
+    """
+    Return (date, symbol) for each calendar day in range that has a futures symbol.
+    Symbols are upper-cased once and month-hint matches computed once per month; only the
+    coverage-range check runs per day.
+    """
+    upper = [row[0].upper() for row in symbols_with_coverage]
+    flags_by_month: Dict[Tuple[int, int], List[bool]] = {}
+    picks: List[Tuple[date, str]] = []
+    for ordinal in range(start_date.toordinal(), end_date.toordinal() + 1):
+        d = date.fromordinal(ordinal)
+        flags = flags_by_month.get((d.year, d.month))
+        if flags is None:
+            flags = flags_by_month[(d.year, d.month)] = _month_hint_flags(d.month, upper)
+        symbol = _pick_from_coverage(d, symbols_with_coverage, flags)
+        if symbol:
+            picks.append((d, symbol))
+    return picks
+
+
+def _bulk_params(exchange: str, symbols: List[str], start_date: date, end_date: date) -> Tuple:
+    """
+    BARS_BULK_SQL parameters: bars from start_date through end_date, and daily high/low from
+    the day before start_date through the day before end_date (the prev days of the range).
+    """
+    window_start, first_trade, last_hl_end, window_end = (
+        datetime.combine(d, datetime.min.time())
+        for d in (
+            start_date - timedelta(days=1),
+            start_date,
+            end_date,
+            end_date + timedelta(days=1),
+        )
+    )
+    return (symbols, exchange, symbols, window_start, window_end, first_trade, last_hl_end)
+
 
-    if side is not None and entry_price is not None:
-        if side == "long":
-            return c - entry_price, "long", "eod"
-        return entry_price - c, "short", "eod"
-    return 0.0, None, "no_setup"
+def _assemble_days(
+    picks: List[Tuple[date, str]],
+    hl_by_day: DailyHL,
+    bars_by_day: BarsByDay,
+) -> List[DayData]:
+    """
+    Join picked symbols with prev-day H/L and trade-day OHLC arrays; skip days missing either.
+    Only days that actually have bars for their picked symbol are visited (weekends and
+    holidays never reach the lookups). Fib levels are computed once here rather than per
+    grid-search combo.
+    """
+    pick_by_date = dict(picks)
+    trading_days = sorted({d for symbol, d in bars_by_day if pick_by_date.get(d) == symbol})
+    out: List[DayData] = []
+    for d in trading_days:
+        symbol = pick_by_date[d]
+        prev_hl = hl_by_day.get((symbol, date.fromordinal(d.toordinal() - 1)))
+        if not prev_hl:
+            continue
+        bars = bars_by_day[(symbol, d)]
+        prev_high, prev_low = prev_hl
+        out.append((d, symbol, prev_high, prev_low, fib_level_array(prev_high, prev_low), *bars))
+    return out
 
 
 def load_all_days_data(
     exchange: str,
     start_date: date,
     end_date: date,
-) -> List[Tuple[date, str, float, float, List[Dict[str, Any]]]]:
+) -> List[DayData]:
     """
     Pre-load (date, symbol, prev_high, prev_low, bars) for each trading day.
+    Bars for every picked symbol are fetched with one range query, which also yields the
+    prev-day H/L.
     Returns list of (d, symbol, prev_high, prev_low, bars).
     """
     start_dt = datetime.combine(start_date, datetime.min.time())
@@ -295,25 +610,65 @@ def load_all_days_data(
     if not symbols_with_coverage:
         return []
 
-    out: List[Tuple[date, str, float, float, List[Dict[str, Any]]]] = []
-    d = start_date
-    while d <= end_date:
-        symbol = pick_symbol_for_date(exchange, d, symbols_with_coverage)
-        if not symbol:
-            d += timedelta(days=1)
-            continue
-        prev_hl = get_prev_day_high_low(exchange, symbol, d)
-        if not prev_hl:
-            d += timedelta(days=1)
-            continue
-        prev_high, prev_low = prev_hl
-        bars = get_bars_for_day(exchange, symbol, d)
-        if not bars:
-            d += timedelta(days=1)
-            continue
-        out.append((d, symbol, prev_high, prev_low, bars))
-        d += timedelta(days=1)
-    return out
+    picks = _pick_days(exchange, start_date, end_date, symbols_with_coverage)
+    if not picks:
+        return []
+
+    symbols = sorted({symbol for _, symbol in picks})
+    hl_by_day, bars_by_day = load_bars_bulk(exchange, symbols, start_date, end_date)
+    return _assemble_days(picks, hl_by_day, bars_by_day)
+
+
+async def load_all_days_data_async(
+    pool: Any,
+    exchange: str,
+    start_date: date,
+    end_date: date,
+) -> List[DayData]:
+    """
+    asyncpg variant of load_all_days_data (same result).
+    """
+    start_dt = datetime.combine(start_date, datetime.min.time())
+    end_dt = datetime.combine(end_date + timedelta(days=30), datetime.min.time())
+    rows = await pool.fetch(_asyncpg_sql(COVERAGE_SQL), exchange, start_dt, end_dt)
+    symbols_with_coverage = [(r[0], r[1], r[2], r[3]) for r in rows if r[1] and r[2]]
+    if not symbols_with_coverage:
+        return []
+
+    picks = _pick_days(exchange, start_date, end_date, symbols_with_coverage)
+    if not picks:
+        return []
+
+    symbols = sorted({symbol for _, symbol in picks})
+    buf = io.BytesIO()
+    async with pool.acquire() as conn:
+        await conn.copy_from_query(
+            _asyncpg_sql(BARS_BULK_SQL),
+            *_bulk_params(exchange, symbols, start_date, end_date),
+            output=buf,
+            format="binary",
+        )
+    return _assemble_days(picks, *_parse_bars_copy(buf.getbuffer(), symbols))
+
+
+async def load_exchanges_async(
+    exchanges: List[str],
+    start_date: date,
+    end_date: date,
+) -> Dict[str, Any]:
+    """
+    Load days_data for all exchanges concurrently over one asyncpg pool.
+    Returns {exchange: days_data or the exception raised while loading it}.
+    """
+    pool = await db.create_async_pool()
+    try:
+        results = await asyncio.gather(
+            *(load_all_days_data_async(pool, ex, start_date, end_date) for ex in exchanges),
+            return_exceptions=True,
+        )
+    finally:
+        await pool.close()
+    return dict(zip(exchanges, results))
 
 
 def backtest_exchange(
@@ -324,11 +679,14 @@ def backtest_exchange(
     target_ext_ratio: float = 1.11,
     stop_buffer: float = 15.0,
     sides: str = "both",
-    days_data: Optional[List[Tuple[date, str, float, float, List[Dict[str, Any]]]]] = None,
+    days_data: Optional[List[DayData]] = None,
+    packed: Optional[PackedDays] = None,
 ) -> Tuple[Dict[date, float], Dict[date, str], Dict[date, Optional[str]], float, str]:
     """
     Backtest Fib prev-day strategy with given params.
-    If days_data is provided, reuse it (for grid search). Returns (daily_pnl, daily_symbol, daily_side, total_pnl, last_symbol).
+    If days_data is provided, reuse it (for grid search). With numba installed, days run through
+    the compiled run_all_days_nb (pass packed=pack_days(days_data) to avoid re-packing per call).
+    Returns (daily_pnl, daily_symbol, daily_side, total_pnl, last_symbol).
     """
     if days_data is None:
         days_data = load_all_days_data(exchange, start_date, end_date)
@@ -341,10 +699,34 @@ def backtest_exchange(
     total_pnl = 0.0
     last_symbol = ""
 
-    for d, symbol, prev_high, prev_low, bars in days_data:
-        fib = fib_levels(prev_high, prev_low)
+    if NUMBA_AVAILABLE:
+        above_idx, below_idx = TARGET_EXT_INDEX.get(target_ext_ratio, TARGET_EXT_INDEX[1.11])
+        pnl_a, side_a = run_all_days_nb(
+            *(packed if packed is not None else pack_days(days_data)),
+            ENTRY_RATIO_INDEX.get(entry_ratio, FIB_INDEX["ret_618"]),
+            above_idx,
+            below_idx,
+            float(stop_buffer),
+            sides in ("both", "long_only"),
+            sides in ("both", "short_only"),
+        )
+        side_names = {1: "long", -1: "short", 0: None}
+        for i, day in enumerate(days_data):
+            d, symbol = day[0], day[1]
+            pnl = float(pnl_a[i])
+            daily_pnl[d] = pnl
+            daily_symbol[d] = symbol
+            daily_side[d] = side_names[int(side_a[i])]
+            total_pnl += pnl
+            last_symbol = symbol
+        return daily_pnl, daily_symbol, daily_side, total_pnl, last_symbol
+
+    for d, symbol, _, _, fib, open_a, high_a, low_a, close_a in days_data:
         pnl, side, _ = run_fib_day(
-            bars,
+            open_a,
+            high_a,
+            low_a,
+            close_a,
             fib,
             stop_buffer_pts=stop_buffer,
             entry_ratio=entry_ratio,
@@ -360,17 +742,214 @@ def backtest_exchange(
     return daily_pnl, daily_symbol, daily_side, total_pnl, last_symbol
 
 
+def _first_true(mask: np.ndarray) -> np.ndarray:
+    """Index of the first True along axis 0 of mask, or len(mask) where there is none."""
+    return np.where(mask.any(axis=0), mask.argmax(axis=0), len(mask))
+
+
+def _exit_pnl_grid(
+    first_stop: np.ndarray,
+    first_target: np.ndarray,
+    stop_pnl: np.ndarray,
+    target_pnl: np.ndarray,
+    eod_pnl: np.ndarray,
+    n_bars: int,
+) -> np.ndarray:
+    """
+    Combine first stop bar (E, S) and first target bar (E, T) into PnL of shape (E, T, S).
+    Same bar: stop wins, as in run_fib_day. Neither hit: eod_pnl (E,).
+    """
+    fs = first_stop[:, None, :]
+    ft = first_target[:, :, None]
+    return np.where(
+        (fs <= ft) & (fs < n_bars),
+        stop_pnl[:, None, :],
+        np.where(ft < n_bars, target_pnl[:, :, None], eod_pnl[:, None, None]),
+    )
+
+
+def evaluate_all_params(
+    days_data: List[DayData],
+    entry_ratios: Tuple[float, ...],
+    target_ratios: Tuple[float, ...],
+    stop_buffers: Tuple[float, ...],
+    sides_list: Tuple[str, ...] = ("both", "long_only", "short_only"),
+) -> np.ndarray:
+    """
+    Total PnL of every parameter combo in one pass over the days.
+    Returns an array of shape (len(entry_ratios), len(target_ratios), len(stop_buffers),
+    len(sides_list)) whose cells equal backtest_exchange's total_pnl for that combo
+    (days are summed in order, so totals match exactly).
+    """
+    return _grid_over_days(
+        (day[4:] for day in days_data), entry_ratios, target_ratios, stop_buffers, sides_list
+    )
+
+
+def _grid_over_days(
+    day_arrays: Any,
+    entry_ratios: Tuple[float, ...],
+    target_ratios: Tuple[float, ...],
+    stop_buffers: Tuple[float, ...],
+    sides_list: Tuple[str, ...],
+) -> np.ndarray:
+    """evaluate_all_params over an iterable of (fib, open, high, low, close) per day."""
+    entry_idx = np.array(
+        [ENTRY_RATIO_INDEX.get(r, FIB_INDEX["ret_618"]) for r in entry_ratios], dtype=np.intp
+    )
+    ext_idx = np.array(
+        [TARGET_EXT_INDEX.get(r, TARGET_EXT_INDEX[1.11]) for r in target_ratios], dtype=np.intp
+    )
+    stop_a = np.array(stop_buffers, dtype=np.float64)
+    grid = np.zeros((len(entry_ratios), len(target_ratios), len(stop_buffers), len(sides_list)))
+    day_grid = np.zeros_like(grid)
+
+    for fib, open_a, high_a, low_a, close_a in day_arrays:
+        n = len(close_a)
+        if n == 0 or fib[FIB_INDEX["range"]] <= 0:
+            continue
+        ret = fib[entry_idx]  # (E,)
+        up = close_a > open_a
+        down = close_a < open_a
+        first_long = _first_true(
+            (low_a[:, None] <= ret) & up[:, None] & (close_a[:, None] > ret)
+        )  # (E,)
+        first_short = _first_true(
+            (high_a[:, None] >= ret) & down[:, None] & (close_a[:, None] < ret)
+        )
+        bar_idx = np.arange(n)
+
+        # Long trade entered on first_long: exits only on later bars
+        entry = close_a[np.minimum(first_long, n - 1)]
+        after = (bar_idx[:, None] > first_long)[:, :, None]  # (n, E, 1)
+        stop_long = ret[:, None] - stop_a  # (E, S)
+        target_long = np.minimum(fib[ext_idx[:, 0]], fib[FIB_INDEX["high"]] + 1)  # (T,)
+        long_pnl = _exit_pnl_grid(
+            _first_true(after & (low_a[:, None, None] <= stop_long)),
+            _first_true(after & (high_a[:, None, None] >= target_long)),
+            stop_long - entry[:, None],
+            target_long - entry[:, None],
+            close_a[-1] - entry,
+            n,
+        )
+
+        entry = close_a[np.minimum(first_short, n - 1)]
+        after = (bar_idx[:, None] > first_short)[:, :, None]
+        stop_short = ret[:, None] + stop_a
+        target_short = np.maximum(fib[ext_idx[:, 1]], fib[FIB_INDEX["low"]] - 1)
+        short_pnl = _exit_pnl_grid(
+            _first_true(after & (high_a[:, None, None] >= stop_short)),
+            _first_true(after & (low_a[:, None, None] <= target_short)),
+            entry[:, None] - stop_short,
+            entry[:, None] - target_short,
+            entry - close_a[-1],
+            n,
+        )
+
+        has_long = (first_long < n)[:, None, None]
+        has_short = (first_short < n)[:, None, None]
+        for k, sides in enumerate(sides_list):
+            if sides == "both":
+                long_first = (first_long < first_short)[:, None, None]
+                day_grid[..., k] = np.where(
+                    long_first, long_pnl, np.where(has_short, short_pnl, 0.0)
+                )
+            elif sides == "long_only":
+                day_grid[..., k] = np.where(has_long, long_pnl, 0.0)
+            elif sides == "short_only":
+                day_grid[..., k] = np.where(has_short, short_pnl, 0.0)
+            else:
+                day_grid[..., k] = 0.0
+        grid += day_grid
+    return grid
+
+
+def _share_packed(packed: PackedDays) -> Tuple[shared_memory.SharedMemory, List[Tuple]]:
+    """Copy packed day arrays into one shared-memory block; returns (block, [(offset, shape, dtype)])."""
+    total = sum(a.nbytes for a in packed)
+    shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+    layout = []
+    pos = 0
+    for a in packed:
+        np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=pos)[...] = a
+        layout.append((pos, a.shape, a.dtype.str))
+        pos += a.nbytes
+    return shm, layout
+
+
+def _eval_param_slice(args: Tuple) -> np.ndarray:
+    """
+    Worker: attach to the shared packed days and evaluate one (entry_ratio, target_ratio)
+    slice of the grid over all days in order.
+    """
+    shm_name, layout, entry_ratio, target_ratio, stop_buffers, sides_list = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        offsets, open_a, high_a, low_a, close_a, fib = (
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=pos)
+            for pos, shape, dtype in layout
+        )
+        day_arrays = (
+            (fib[i], open_a[lo:hi], high_a[lo:hi], low_a[lo:hi], close_a[lo:hi])
+            for i, (lo, hi) in enumerate(zip(offsets[:-1], offsets[1:]))
+        )
+        grid = _grid_over_days(
+            day_arrays, (entry_ratio,), (target_ratio,), stop_buffers, sides_list
+        )
+        del offsets, open_a, high_a, low_a, close_a, fib, day_arrays
+        return grid[0, 0]
+    finally:
+        shm.close()
+
+
+def evaluate_all_params_parallel(
+    days_data: List[DayData],
+    entry_ratios: Tuple[float, ...],
+    target_ratios: Tuple[float, ...],
+    stop_buffers: Tuple[float, ...],
+    sides_list: Tuple[str, ...],
+    workers: int,
+) -> np.ndarray:
+    """
+    evaluate_all_params split across worker processes, one task per (entry, target) pair.
+    Days are packed once into shared memory, so tasks carry only the block name and layout.
+    Each task still sums its days in order, so the grid is identical to the serial one.
+    """
+    shm, layout = _share_packed(pack_days(days_data))
+    try:
+        pairs = list(itertools.product(range(len(entry_ratios)), range(len(target_ratios))))
+        tasks = [
+            (shm.name, layout, entry_ratios[i], target_ratios[j], stop_buffers, sides_list)
+            for i, j in pairs
+        ]
+        grid = np.zeros((len(entry_ratios), len(target_ratios), len(stop_buffers), len(sides_list)))
+        # spawn, not fork: the parent may already be running numba/OpenMP threads
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            for (i, j), cell in zip(pairs, executor.map(_eval_param_slice, tasks)):
+                grid[i, j] = cell
+        return grid
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def grid_search_best_intraday(
     exchange: str,
     start_date: date,
     end_date: date,
     quick: bool = False,
+    days_data: Optional[List[DayData]] = None,
+    workers: int = 1,
 ) -> Tuple[Dict[str, Any], List[Tuple[date, str, Optional[str], float]]]:
     """
     Grid search over entry_ratio, target_ext_ratio, stop_buffer, sides.
+    If days_data is provided (e.g. loaded with --async), it is used instead of querying.
+    workers > 1 evaluates the grid in that many processes (same result).
     Returns (best_params_dict, best_daily_list).
     """
-    days_data = load_all_days_data(exchange, start_date, end_date)
+    if days_data is None:
+        days_data = load_all_days_data(exchange, start_date, end_date)
     if not days_data:
         return {}, []
 
@@ -385,40 +964,38 @@ def grid_search_best_intraday(
         stop_buffers = (10, 15, 20, 25)
         sides_list = ("both", "long_only", "short_only")
 
-    best_total = -1e9
-    best_params: Dict[str, Any] = {}
-    best_daily: Dict[date, float] = {}
-    best_symbol: Dict[date, str] = {}
-    best_side: Dict[date, Optional[str]] = {}
-
-    for entry_ratio in entry_ratios:
-        for target_ratio in target_ratios:
-            for stop_buf in stop_buffers:
-                for sides in sides_list:
-                    daily_pnl, daily_symbol, daily_side, total_pnl, _ = backtest_exchange(
-                        exchange,
-                        start_date,
-                        end_date,
-                        entry_ratio=entry_ratio,
-                        target_ext_ratio=target_ratio,
-                        stop_buffer=stop_buf,
-                        sides=sides,
-                        days_data=days_data,
-                    )
-                    if total_pnl > best_total:
-                        best_total = total_pnl
-                        best_params = {
-                            "entry_ratio": entry_ratio,
-                            "target_ext_ratio": target_ratio,
-                            "stop_buffer": stop_buf,
-                            "sides": sides,
-                            "total_pnl": total_pnl,
-                            "trades": sum(1 for s in daily_side.values() if s),
-                            "days": len(daily_pnl),
-                        }
-                        best_daily = dict(daily_pnl)
-                        best_symbol = dict(daily_symbol)
-                        best_side = dict(daily_side)
+    if workers > 1:
+        grid = evaluate_all_params_parallel(
+            days_data, entry_ratios, target_ratios, stop_buffers, sides_list, workers
+        )
+    else:
+        grid = evaluate_all_params(days_data, entry_ratios, target_ratios, stop_buffers, sides_list)
+    # days_data is non-empty, so every combo has a finite total (0.0 when it never trades) and,
+    # like the per-combo loop this replaced, the first combo with the highest total wins
+    best = np.unravel_index(grid.argmax(), grid.shape)
+    entry_ratio = entry_ratios[best[0]]
+    target_ratio = target_ratios[best[1]]
+    stop_buf = stop_buffers[best[2]]
+    sides = sides_list[best[3]]
+    best_daily, best_symbol, best_side, total_pnl, _ = backtest_exchange(
+        exchange,
+        start_date,
+        end_date,
+        entry_ratio=entry_ratio,
+        target_ext_ratio=target_ratio,
+        stop_buffer=stop_buf,
+        sides=sides,
+        days_data=days_data,
+    )
+    best_params = {
+        "entry_ratio": entry_ratio,
+        "target_ext_ratio": target_ratio,
+        "stop_buffer": stop_buf,
+        "sides": sides,
+        "total_pnl": total_pnl,
+        "trades": sum(1 for s in best_side.values() if s),
+        "days": len(best_daily),
+    }
 
     daily_list = [
         (d, best_symbol[d], best_side[d], best_daily[d]) for d in sorted(best_daily.keys())
@@ -447,7 +1024,20 @@ def main() -> None:
     parser.add_argument(
         "--quick", action="store_true", help="Fewer param combos for faster grid search"
     )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Load all exchanges concurrently with asyncpg (pip install asyncpg)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for the grid search (0 = one per CPU; default 1)",
+    )
     args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
 
     start_date = datetime.strptime(args.start, "%Y-%m-%d").date()
     if args.end:
@@ -455,10 +1045,11 @@ def main() -> None:
     else:
         start_dt = datetime.combine(start_date, datetime.min.time())
         end_date = date.today()
-        for ex in args.exchange or ["NSE", "BSE"]:
-            latest = get_latest_date_in_db(ex, start_dt)
-            if latest:
-                end_date = latest
+        exchanges = args.exchange or ["NSE", "BSE"]
+        latest = get_latest_dates_in_db(exchanges, start_dt)
+        for ex in exchanges:
+            if ex in latest:
+                end_date = latest[ex]
                 break
 
     if not args.exchange:
@@ -475,12 +1066,23 @@ def main() -> None:
 
     all_daily: Dict[str, Dict[date, float]] = {}
     all_best_params: Dict[str, Dict[str, Any]] = {}
+    preloaded: Dict[str, Any] = {}
+    if args.use_async:
+        preloaded = asyncio.run(load_exchanges_async(args.exchange, start_date, end_date))
 
     for exchange in args.exchange:
         try:
+            days_data = preloaded.get(exchange)
+            if isinstance(days_data, Exception):
+                raise days_data
             if run_best:
                 best_params, daily_list = grid_search_best_intraday(
-                    exchange, start_date, end_date, quick=args.quick
+                    exchange,
+                    start_date,
+                    end_date,
+                    quick=args.quick,
+                    days_data=days_data,
+                    workers=workers,
                 )
                 if not best_params:
                     print(f"{exchange}: No data.\n")
@@ -492,7 +1094,7 @@ def main() -> None:
                 total_pnl = best_params["total_pnl"]
             else:
                 daily_pnl, daily_symbol, daily_side, total_pnl, _ = backtest_exchange(
-                    exchange, start_date, end_date
+                    exchange, start_date, end_date, days_data=days_data
                 )
         except Exception as e:
             print(f"{exchange}: Error - {e}\n")
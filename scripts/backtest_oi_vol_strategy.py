@@ -12,12 +12,17 @@ Usage (from project root):
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import multiprocessing
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 # Project root
@@ -26,57 +31,60 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import database as db  # noqa: E402
+from scripts._backtest_njit import _simulate, _simulate_into, trade_buffers  # noqa: E402
 
 # Resolutions treated as 1m
 RES_VARIANTS = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE")
+# Literal IN list, a subset of the database.HOT_BARS_INDEX_SQL predicate, so the planner can
+# prove the partial index applies (a bound array parameter hides the values from it)
+RES_IN_SQL = "resolution IN (" + ", ".join(f"'{r}'" for r in RES_VARIANTS) + ")"
+
+# Column layouts of the load_oi_vol / load_bars_1m result rows
+OI_VOL_COLUMNS = ["timestamp", "ce_oi_pct", "pe_oi_pct", "ce_vol_pct", "pe_vol_pct"]
+BAR_COLUMNS = ["timestamp", "open", "high", "low", "close", "volume", "oi"]
+OHLC_COLUMNS = ["open", "high", "low", "close"]
+# load_bars_1m select list over multi_resolution_bars b: symbol, then BAR_COLUMNS.
+# OHLC arrive as float8 with NULL mapped to NaN, so each column casts to float64 in one go.
+BARS_SELECT = ", ".join(
+    [
+        "b.symbol",
+        "b.timestamp",
+        *(f"COALESCE(b.{c}_price::float8, 'NaN')" for c in OHLC_COLUMNS),
+        "b.volume",
+        "b.oi",
+    ]
+)
 
 
 def load_oi_vol(exchange: str, start_dt: datetime, end_dt: datetime) -> pd.DataFrame:
     """Load ml_features (OI/Vol % change) for exchange and range."""
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT
-            timestamp,
-            itm_oi_ce_pct_change_3m_wavg AS ce_oi_pct,
-            itm_oi_pe_pct_change_3m_wavg AS pe_oi_pct,
-            feature_payload
-        FROM ml_features
-        WHERE exchange = %s
-          AND timestamp >= %s
-          AND timestamp < %s
-        ORDER BY timestamp
-        """,
-        (exchange, start_dt, end_dt),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-
-    records = []
-    for ts, ce_oi, pe_oi, payload in rows:
-        ce_vol = pe_vol = None
-        if payload:
-            try:
-                p = json.loads(payload) if isinstance(payload, str) else payload
-                if isinstance(p, dict):
-                    ce_vol = p.get("itm_volume_ce_pct_change_3m_wavg")
-                    pe_vol = p.get("itm_volume_pe_pct_change_3m_wavg")
-            except Exception:
-                pass
-        records.append(
-            {
-                "timestamp": ts,
-                "ce_oi_pct": float(ce_oi) if ce_oi is not None else None,
-                "pe_oi_pct": float(pe_oi) if pe_oi is not None else None,
-                "ce_vol_pct": float(ce_vol) if ce_vol is not None else None,
-                "pe_vol_pct": float(pe_vol) if pe_vol is not None else None,
-            }
+    # Volume % change lives in feature_payload; extract it in SQL so only floats cross the wire
+    # (bad JSON and values that are not numbers become NULL rather than failing the query)
+    with db.db_cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT
+                timestamp,
+                itm_oi_ce_pct_change_3m_wavg::float8 AS ce_oi_pct,
+                itm_oi_pe_pct_change_3m_wavg::float8 AS pe_oi_pct,
+                {db.json_float_sql("feature_payload", "itm_volume_ce_pct_change_3m_wavg")}
+                    AS ce_vol_pct,
+                {db.json_float_sql("feature_payload", "itm_volume_pe_pct_change_3m_wavg")}
+                    AS pe_vol_pct
+            FROM ml_features
+            WHERE exchange = %s
+              AND timestamp >= %s
+              AND timestamp < %s
+            ORDER BY timestamp
+            """,
+            (exchange, start_dt, end_dt),
         )
+        rows = cur.fetchall()
 
-    if not records:
+    if not rows:
         return pd.DataFrame()
-    df = pd.DataFrame(records)
+    df = pd.DataFrame.from_records(rows, columns=OI_VOL_COLUMNS)
+    df[OI_VOL_COLUMNS[1:]] = df[OI_VOL_COLUMNS[1:]].astype("float64")
     df["timestamp"] = pd.to_datetime(df["timestamp"], utc=True)
     return df
 
@@ -84,192 +92,218 @@ def load_oi_vol(exchange: str, start_dt: datetime, end_dt: datetime) -> pd.DataF
 def load_bars_1m(
     exchange: str, start_dt: datetime, end_dt: datetime, symbol: Optional[str] = None
 ) -> Tuple[Optional[str], pd.DataFrame]:
-    """Load 1m OHLC bars; if symbol not given, pick symbol with most bars. Returns (symbol, df)."""
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-
-    chosen = symbol
-    if not chosen:
-        cur.execute(
-            """
-            SELECT symbol, COUNT(*) AS c
-            FROM multi_resolution_bars
-            WHERE exchange = %s
-              AND timestamp >= %s
-              AND timestamp < %s
-              AND resolution = ANY(%s)
-              AND symbol IS NOT NULL
-            GROUP BY symbol
-            ORDER BY c DESC
-            LIMIT 1
-            """,
-            (exchange, start_dt, end_dt, list(RES_VARIANTS)),
-        )
-        row = cur.fetchone()
-        if row and row[0]:
-            chosen = row[0]
-
-    bars = []
-    if chosen:
-        cur.execute(
-            """
-            SELECT timestamp, open_price, high_price, low_price, close_price, volume, oi
-            FROM multi_resolution_bars
-            WHERE exchange = %s AND symbol = %s
-              AND timestamp >= %s AND timestamp < %s
-              AND resolution = ANY(%s)
-            ORDER BY timestamp
-            """,
-            (exchange, chosen, start_dt, end_dt, list(RES_VARIANTS)),
-        )
-        for row in cur.fetchall():
-            bars.append(
-                {
-                    "timestamp": row[0],
-                    "open": float(row[1]) if row[1] is not None else None,
-                    "high": float(row[2]) if row[2] is not None else None,
-                    "low": float(row[3]) if row[3] is not None else None,
-                    "close": float(row[4]) if row[4] is not None else None,
-                    "volume": row[5],
-                    "oi": row[6],
-                }
+    """
+    Load 1m OHLC bars; if symbol not given, pick symbol with most bars. Returns (symbol, df).
+    The pick and the fetch are one query; bars are streamed through a server-side cursor.
+    """
+    if symbol:
+        sql = f"""
+            SELECT {BARS_SELECT}
+            FROM multi_resolution_bars b
+            WHERE b.exchange = %s AND b.symbol = %s
+              AND b.timestamp >= %s AND b.timestamp < %s
+              AND b.{RES_IN_SQL}
+            ORDER BY b.timestamp
+        """
+        params: Tuple = (exchange, symbol, start_dt, end_dt)
+    else:
+        sql = f"""
+            WITH top AS (
+                SELECT symbol
+                FROM multi_resolution_bars
+                WHERE exchange = %s
+                  AND timestamp >= %s
+                  AND timestamp < %s
+                  AND {RES_IN_SQL}
+                  AND symbol IS NOT NULL
+                GROUP BY symbol
+                ORDER BY COUNT(*) DESC
+                LIMIT 1
             )
-    db.release_db_connection(conn)
-
-    if not bars:
-        return chosen, pd.DataFrame()
-    bdf = pd.DataFrame(bars)
-    bdf["timestamp"] = pd.to_datetime(bdf["timestamp"], utc=True)
+            SELECT {BARS_SELECT}
+            FROM multi_resolution_bars b
+            JOIN top USING (symbol)
+            WHERE b.exchange = %s
+              AND b.timestamp >= %s AND b.timestamp < %s
+              AND b.{RES_IN_SQL}
+            ORDER BY b.timestamp
+        """
+        params = (exchange, start_dt, end_dt, exchange, start_dt, end_dt)
+
+    rows: List[Tuple] = []
+    with db.db_cursor(name="bars_stream") as cur:
+        cur.itersize = 10000
+        cur.execute(sql, params)
+        rows.extend(cur)
+
+    if not rows:
+        return symbol, pd.DataFrame()
+    # Every row carries the (chosen) symbol as its first column
+    chosen = rows[0][0]
+    _, ts, *ohlc, volume, oi = zip(*rows)
+    bdf = pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(ts, utc=True),
+            **{name: np.array(col, dtype=np.float64) for name, col in zip(OHLC_COLUMNS, ohlc)},
+            "volume": volume,
+            "oi": oi,
+        },
+        columns=BAR_COLUMNS,
+    )
     return chosen, bdf
 
 
 def merge_oi_vol_into_bars(oi_df: pd.DataFrame, bars_df: pd.DataFrame) -> pd.DataFrame:
-    """Forward-fill OI/Vol onto each bar by timestamp (merge_asof)."""
+    """
+    Forward-fill OI/Vol onto each bar by timestamp (latest OI row at or before the bar).
+    Both frames must be sorted by timestamp, as the loaders return them.
+    """
     if oi_df.empty or bars_df.empty:
         return pd.DataFrame()
-    oi_df = oi_df.sort_values("timestamp")
-    bars_df = bars_df.sort_values("timestamp")
-    merged = pd.merge_asof(
-        bars_df,
-        oi_df,
-        on="timestamp",
-        direction="backward",
-        suffixes=("", "_oi"),
-    )
+    # Checked once here, so day_slices and the simulator can rely on bar order without re-sorting
+    for name, df in (("OI/Vol", oi_df), ("bars", bars_df)):
+        if not df["timestamp"].is_monotonic_increasing:
+            raise ValueError(f"{name} rows must be sorted by timestamp")
+    oi_ts = oi_df["timestamp"].to_numpy(dtype="datetime64[ns]")
+    bar_ts = bars_df["timestamp"].to_numpy(dtype="datetime64[ns]")
+    idx = np.searchsorted(oi_ts, bar_ts, side="right") - 1
+    before_first = idx < 0
+    idx[before_first] = 0
+
+    def gather(name: str) -> np.ndarray:
+        values = oi_df[name].to_numpy(dtype=np.float64, na_value=np.nan)[idx]
+        values[before_first] = np.nan
+        return values
+
+    return bars_df.assign(**{name: gather(name) for name in OI_VOL_COLUMNS[1:]})
+
+
+def add_spreads(merged: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add oi_spread (CE OI % - PE OI %) and vol_spread (CE Vol % - PE Vol %) columns, counting
+    missing OI/Vol values as 0. Every rule is built from these two columns. They stay
+    float64 so compute_signals and compute_signal_matrix compare against thresholds exactly.
+    """
+
+    def col(name: str) -> np.ndarray:
+        return np.nan_to_num(merged[name].to_numpy(dtype=np.float64, na_value=np.nan), nan=0.0)
+
+    merged["oi_spread"] = col("ce_oi_pct") - col("pe_oi_pct")
+    merged["vol_spread"] = col("ce_vol_pct") - col("pe_vol_pct")
     return merged
 
 
-def compute_signal_row(row: pd.Series, rule: str, thresh: float, vol_weight: float = 0.5) -> int:
+def signal_strength(merged: pd.DataFrame, rule: str, vol_weight: float = 0.5) -> np.ndarray:
     """
-    Return 1 = BUY (long), -1 = SELL (short), 0 = flat.
+    Signal strength s per bar for rule, from the add_spreads columns.
     rule: 'oi_spread' | 'vol_spread' | 'oi_plus_vol' | 'pe_dominance' | 'ce_dominance'
     """
-    ce_oi = row.get("ce_oi_pct")
-    pe_oi = row.get("pe_oi_pct")
-    ce_vol = row.get("ce_vol_pct")
-    pe_vol = row.get("pe_vol_pct")
-
-    def safe(x):
-        return float(x) if x is not None and pd.notna(x) else 0.0
-
-    if rule == "oi_spread":
-        # CE OI % - PE OI %: positive = call buildup (bullish), negative = put buildup (bearish)
-        s = safe(ce_oi) - safe(pe_oi)
-    elif rule == "vol_spread":
-        s = safe(ce_vol) - safe(pe_vol)
-    elif rule == "oi_plus_vol":
-        s = (safe(ce_oi) - safe(pe_oi)) + vol_weight * (safe(ce_vol) - safe(pe_vol))
-    elif rule == "pe_dominance":
+    # oi_spread > 0 = call buildup (bullish), < 0 = put buildup (bearish)
+    oi_spread = merged["oi_spread"].to_numpy()
+    vol_spread = merged["vol_spread"].to_numpy()
+    if rule == "oi_plus_vol":
+        return oi_spread + vol_weight * vol_spread
+    by_rule = {
+        "oi_spread": oi_spread,
+        "vol_spread": vol_spread,
         # PE > CE => bearish
-        s = safe(pe_oi) - safe(ce_oi)
-    elif rule == "ce_dominance":
-        s = safe(ce_oi) - safe(pe_oi)
-    else:
-        s = safe(ce_oi) - safe(pe_oi)
+        "pe_dominance": -oi_spread,
+        "ce_dominance": oi_spread,
+    }
+    return by_rule.get(rule, oi_spread)
+
+
+def compute_signals(strength: np.ndarray, thresh: float) -> np.ndarray:
+    """Return int8 signals: 1 = BUY (long), -1 = SELL (short), 0 = flat."""
+    return np.where(strength > thresh, 1, np.where(strength < -thresh, -1, 0)).astype(np.int8)
+
 
-    if s > thresh:
-        return 1
-    if s < -thresh:
-        return -1
-    return 0
+def compute_signal_matrix(strength: np.ndarray, thresholds: List[float]) -> np.ndarray:
+    """compute_signals for every threshold at once: int8 array of shape (len(thresholds), N)."""
+    t = np.asarray(thresholds, dtype=np.float64)[:, None]
+    return np.where(strength > t, 1, np.where(strength < -t, -1, 0)).astype(np.int8)
 
 
 def backtest_day(
-    day_df: pd.DataFrame,
-    rule: str,
-    thresh: float,
+    open_arr: np.ndarray,
+    close_arr: np.ndarray,
+    sig_arr: np.ndarray,
     hold_bars: int,
-    vol_weight: float = 0.5,
     min_bars_after_signal: int = 1,
 ) -> Tuple[float, int, List[Dict[str, Any]]]:
     """
-    Run single-day backtest. Enters at bar open after signal, exits after hold_bars or opposite signal.
+    Run single-day backtest over the day's bar opens/closes and precomputed signals.
+    Enters at bar open after signal, exits after hold_bars or opposite signal.
     Returns (total_pnl_points, num_trades, list of trade dicts).
     """
-    trades: List[Dict[str, Any]] = []
-    position = 0  # 1 long, -1 short, 0 flat
-    entry_bar_idx: Optional[int] = None
-    entry_price: Optional[float] = None
-
-    for i in range(len(day_df)):
-        row = day_df.iloc[i]
-        open_p = row.get("open")
-        close_p = row.get("close")
-        if open_p is None or close_p is None:
-            continue
+    total_pnl, num_trades, entry_idx, exit_idx, exit_price, pnl = _simulate(
+        open_arr, close_arr, sig_arr, hold_bars, min_bars_after_signal
+    )
+    if not num_trades:
+        return 0, 0, []
+    # Entry prices and sides gathered for all trades at once; a side is the signal before entry
+    entry_price = open_arr[entry_idx].tolist()
+    is_long = (sig_arr[entry_idx - 1] == 1).tolist()
+    trades = [
+        {
+            "entry_bar": entry,
+            "exit_bar": exit_bar,
+            "entry_price": entry_px,
+            "exit_price": exit_px,
+            "side": "long" if long_side else "short",
+            "pnl_points": p,
+        }
+        for entry, exit_bar, entry_px, exit_px, long_side, p in zip(
+            entry_idx.tolist(),
+            exit_idx.tolist(),
+            entry_price,
+            exit_price.tolist(),
+            is_long,
+            pnl.tolist(),
+        )
+    ]
+    return total_pnl, num_trades, trades
+
+
+def day_slices(merged: pd.DataFrame) -> List[Tuple[date, int, int]]:
+    """Return (date, start, stop) row ranges per day of a timestamp-sorted merged frame."""
+    if merged.empty:
+        return []
+    # UTC day numbers; only the first bar of each day is turned into a date object
+    day_code = merged["timestamp"].to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+    bounds = np.concatenate(
+        ([0], np.flatnonzero(np.diff(day_code.view(np.int64))) + 1, [len(day_code)])
+    ).tolist()
+    dates = day_code[bounds[:-1]].tolist()
+    return list(zip(dates, bounds[:-1], bounds[1:]))
+
+
+@functools.lru_cache(maxsize=8)
+def _prepare_merged(
+    exchange: str, start_date: date, end_date: date
+) -> Tuple[pd.DataFrame, List[Tuple[date, int, int]]]:
+    """
+    Load OI/Vol and 1m bars once and merge them, for reuse across backtest_exchange calls.
+    Returns (merged, day_slices); both are empty if either side has no data.
+    Results are cached per (exchange, start_date, end_date) and must not be mutated;
+    call clear_cache() to pick up new data in a long-running process.
+    """
+    start_dt = datetime.combine(start_date, datetime.min.time())
+    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
 
-        sig = compute_signal_row(row, rule, thresh, vol_weight)
-
-        if position != 0:
-            # Check exit: hold_bars elapsed or opposite signal
-            bars_held = i - entry_bar_idx if entry_bar_idx is not None else 0
-            exit_signal = (sig == -position) or (hold_bars > 0 and bars_held >= hold_bars)
-            if exit_signal and entry_price is not None:
-                exit_price = open_p  # exit at open of current bar (or use close for same bar)
-                if position == 1:
-                    pnl = exit_price - entry_price
-                else:
-                    pnl = entry_price - exit_price
-                trades.append(
-                    {
-                        "entry_bar": entry_bar_idx,
-                        "exit_bar": i,
-                        "entry_price": entry_price,
-                        "exit_price": exit_price,
-                        "side": "long" if position == 1 else "short",
-                        "pnl_points": pnl,
-                    }
-                )
-                position = 0
-                entry_bar_idx = None
-                entry_price = None
-
-        if position == 0 and sig != 0 and i + min_bars_after_signal < len(day_df):
-            # Enter at next bar open
-            next_open = day_df.iloc[i + 1].get("open") if i + 1 < len(day_df) else None
-            if next_open is not None:
-                position = sig
-                entry_bar_idx = i + 1
-                entry_price = next_open
-
-    # Unclosed position: mark to market at last close
-    if position != 0 and entry_price is not None and len(day_df) > 0:
-        last_close = day_df.iloc[-1].get("close")
-        if last_close is not None:
-            pnl = (last_close - entry_price) if position == 1 else (entry_price - last_close)
-            trades.append(
-                {
-                    "entry_bar": entry_bar_idx,
-                    "exit_bar": len(day_df) - 1,
-                    "entry_price": entry_price,
-                    "exit_price": last_close,
-                    "side": "long" if position == 1 else "short",
-                    "pnl_points": pnl,
-                }
-            )
+    oi_df = load_oi_vol(exchange, start_dt, end_dt)
+    symbol, bars_df = load_bars_1m(exchange, start_dt, end_dt, symbol=None)
+
+    if oi_df.empty or bars_df.empty:
+        return pd.DataFrame(), []
+
+    merged = add_spreads(merge_oi_vol_into_bars(oi_df, bars_df))
+    return merged, day_slices(merged)
 
-    total_pnl = sum(t["pnl_points"] for t in trades)
-    return total_pnl, len(trades), trades
+
+def clear_cache() -> None:
+    """Drop the loaded data cached by _prepare_merged."""
+    _prepare_merged.cache_clear()
 
 
 def backtest_exchange(
@@ -280,36 +314,66 @@ def backtest_exchange(
     thresh: float,
     hold_bars: int,
     vol_weight: float = 0.5,
+    prepared: Optional[Tuple[pd.DataFrame, List[Tuple[date, int, int]]]] = None,
 ) -> Tuple[Dict[date, float], float, int, Dict]:
-    """Backtest over date range, day-by-day. Returns (daily_pnl, total_pnl, total_trades, best_day_detail)."""
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+    """
+    Backtest over date range, day-by-day. Returns (daily_pnl, total_pnl, total_trades, best_day_detail).
+    If prepared (from _prepare_merged) is given, it is used instead of querying.
+    """
+    if prepared is None:
+        prepared = _prepare_merged(exchange, start_date, end_date)
+    merged, slices = prepared
+    if not slices:
+        return {}, 0.0, 0, {}
 
-    oi_df = load_oi_vol(exchange, start_dt, end_dt)
-    symbol, bars_df = load_bars_1m(exchange, start_dt, end_dt, symbol=None)
+    sig_arr = compute_signals(signal_strength(merged, rule, vol_weight), thresh)
+    open_arr, close_arr = _open_close(merged)
+    day_pnl, num_trades = _day_totals(open_arr, close_arr, slices, sig_arr, hold_bars)
+    return _summarize(slices, day_pnl, num_trades)
 
-    if oi_df.empty or bars_df.empty:
-        return {}, 0.0, 0, {}
 
-    merged = merge_oi_vol_into_bars(oi_df, bars_df)
-    merged["date"] = merged["timestamp"].dt.date
+def _open_close(merged: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """Bar opens and closes of the merged frame as float64 arrays."""
+    return (
+        merged["open"].to_numpy(dtype=np.float64, na_value=np.nan),
+        merged["close"].to_numpy(dtype=np.float64, na_value=np.nan),
+    )
 
-    daily_pnl: Dict[date, float] = {}
-    all_trades: List[Dict] = []
-    best_day_detail: Dict = {}
 
-    for d, day_df in merged.groupby("date"):
-        day_df = day_df.sort_values("timestamp").reset_index(drop=True)
-        pnl, num_trades, trades = backtest_day(
-            day_df, rule=rule, thresh=thresh, hold_bars=hold_bars, vol_weight=vol_weight
+def _day_totals(
+    open_arr: np.ndarray,
+    close_arr: np.ndarray,
+    slices: List[Tuple[Any, int, int]],
+    sig_arr: np.ndarray,
+    hold_bars: int,
+) -> Tuple[np.ndarray, int]:
+    """
+    Simulate each day slice with precomputed signals.
+    Returns (PnL per slice, total trades); trade dicts are left to backtest_day.
+    """
+    day_pnl = np.zeros(len(slices))
+    total_trades = 0
+    # One set of trade buffers, sized for the longest day, reused by every slice
+    out = trade_buffers(max((hi - lo for _, lo, hi in slices), default=0))
+    for i, (_, lo, hi) in enumerate(slices):
+        pnl, num_trades = _simulate_into(
+            open_arr[lo:hi], close_arr[lo:hi], sig_arr[lo:hi], hold_bars, out
         )
-        daily_pnl[d] = pnl
-        all_trades.extend(trades)
+        if num_trades:
+            day_pnl[i] = pnl
+            total_trades += num_trades
+    return day_pnl, total_trades
+
 
+def _summarize(
+    slices: List[Tuple[date, int, int]], day_pnl: np.ndarray, total_trades: int
+) -> Tuple[Dict[date, float], float, int, Dict]:
+    """Turn _day_totals output into backtest_exchange's (daily_pnl, total, trades, best_day)."""
+    daily_pnl: Dict[date, float] = {d: p for (d, _, _), p in zip(slices, day_pnl.tolist())}
     total_pnl = sum(daily_pnl.values())
-    total_trades = len(all_trades)
 
     # Best day (max PnL)
+    best_day_detail: Dict = {}
     if daily_pnl:
         best_date = max(daily_pnl, key=daily_pnl.get)
         best_day_detail = {"date": best_date, "pnl": daily_pnl[best_date]}
@@ -317,6 +381,65 @@ def backtest_exchange(
     return daily_pnl, total_pnl, total_trades, best_day_detail
 
 
+def _share_arrays(arrays: List[np.ndarray]) -> Tuple[shared_memory.SharedMemory, List[Tuple]]:
+    """Copy arrays into one shared-memory block; returns (block, [(offset, shape, dtype)])."""
+    shm = shared_memory.SharedMemory(create=True, size=max(sum(a.nbytes for a in arrays), 1))
+    layout = []
+    pos = 0
+    for a in arrays:
+        np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf, offset=pos)[...] = a
+        layout.append((pos, a.shape, a.dtype.str))
+        pos += a.nbytes
+    return shm, layout
+
+
+def _eval_signal_row(args: Tuple) -> Tuple[np.ndarray, List[int]]:
+    """
+    Worker: attach to the shared (open, close, day bounds, signal rows) block and run row m
+    for every hold_bars. Returns (PnL per day for each hold_bars, trades for each hold_bars).
+    """
+    shm_name, layout, m, hold_bars_list = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        open_arr, close_arr, bounds, sig_rows = (
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=pos)
+            for pos, shape, dtype in layout
+        )
+        slices = [(None, lo, hi) for lo, hi in bounds.tolist()]
+        per_hold = [
+            _day_totals(open_arr, close_arr, slices, sig_rows[m], hold_bars)
+            for hold_bars in hold_bars_list
+        ]
+        del open_arr, close_arr, bounds, sig_rows
+        return np.stack([p for p, _ in per_hold]), [t for _, t in per_hold]
+    finally:
+        shm.close()
+
+
+def _grid_parallel(
+    merged: pd.DataFrame,
+    slices: List[Tuple[date, int, int]],
+    sig_rows: np.ndarray,
+    hold_bars_list: List[int],
+    workers: int,
+) -> List[Tuple[np.ndarray, List[int]]]:
+    """
+    _eval_signal_row for every row of sig_rows across worker processes.
+    Bars and signals are copied once into shared memory, so tasks carry only the block name.
+    """
+    bounds = np.array([(lo, hi) for _, lo, hi in slices], dtype=np.int64)
+    shm, layout = _share_arrays([*_open_close(merged), bounds, sig_rows])
+    try:
+        tasks = [(shm.name, layout, m, hold_bars_list) for m in range(len(sig_rows))]
+        # spawn, not fork: the parent may already be running numba threads
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            return list(executor.map(_eval_signal_row, tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+
 def grid_search(
     exchange: str,
     start_date: date,
@@ -326,8 +449,12 @@ def grid_search(
     hold_bars_list: Optional[List[int]] = None,
     vol_weights: Optional[List[float]] = None,
     quick: bool = False,
+    workers: int = 1,
 ) -> List[Dict[str, Any]]:
-    """Try combinations of rule, thresh, hold_bars, vol_weight; return sorted by total PnL."""
+    """
+    Try combinations of rule, thresh, hold_bars, vol_weight; return sorted by total PnL.
+    workers > 1 runs the combos in that many processes (same result).
+    """
     if quick:
         rules = rules or ["oi_spread", "oi_plus_vol", "vol_spread"]
         thresholds = thresholds or [0.2, 0.5, 1.0]
@@ -339,37 +466,55 @@ def grid_search(
         hold_bars_list = hold_bars_list or [3, 5, 10, 15, 30]
         vol_weights = vol_weights or [0.3, 0.5, 0.7]
 
+    merged, slices = _prepare_merged(exchange, start_date, end_date)
+
+    # (rule, vol_weight) signal sources; oi_plus_vol is the only rule that uses vol_weight
+    sources = [
+        (rule, vw) for rule in rules for vw in (vol_weights if rule == "oi_plus_vol" else [None])
+    ]
+    # outcomes[(rule, vw, k, hold_bars)] = (daily_pnl, total_pnl, num_trades, best_day)
+    outcomes: Dict[Tuple, Tuple] = {}
+    if slices:
+        # Signals for every threshold at once, per source: row s * K + k is thresholds[k]
+        sig_rows = np.concatenate(
+            [
+                compute_signal_matrix(
+                    signal_strength(merged, rule, 0.5 if vw is None else vw), thresholds
+                )
+                for rule, vw in sources
+            ]
+        )
+        if workers > 1:
+            row_results = _grid_parallel(merged, slices, sig_rows, hold_bars_list, workers)
+        else:
+            open_arr, close_arr = _open_close(merged)
+            row_results = []
+            for sig_arr in sig_rows:
+                per_hold = [
+                    _day_totals(open_arr, close_arr, slices, sig_arr, hold_bars)
+                    for hold_bars in hold_bars_list
+                ]
+                row_results.append((np.stack([p for p, _ in per_hold]), [t for _, t in per_hold]))
+        for m, (day_pnls, trades) in enumerate(row_results):
+            rule, vw = sources[m // len(thresholds)]
+            k = m % len(thresholds)
+            for j, hold_bars in enumerate(hold_bars_list):
+                outcomes[(rule, vw, k, hold_bars)] = _summarize(slices, day_pnls[j], trades[j])
+
     results = []
     for rule in rules:
-        for thresh in thresholds:
+        for k, thresh in enumerate(thresholds):
             for hold_bars in hold_bars_list:
-                if rule == "oi_plus_vol":
-                    for vw in vol_weights:
-                        daily, total_pnl, num_trades, best = backtest_exchange(
-                            exchange, start_date, end_date, rule, thresh, hold_bars, vol_weight=vw
-                        )
-                        results.append(
-                            {
-                                "rule": rule,
-                                "thresh": thresh,
-                                "hold_bars": hold_bars,
-                                "vol_weight": vw,
-                                "total_pnl_points": round(total_pnl, 2),
-                                "num_trades": num_trades,
-                                "daily_pnl": daily,
-                                "best_day": best,
-                            }
-                        )
-                else:
-                    daily, total_pnl, num_trades, best = backtest_exchange(
-                        exchange, start_date, end_date, rule, thresh, hold_bars
+                for vw in vol_weights if rule == "oi_plus_vol" else [None]:
+                    daily, total_pnl, num_trades, best = outcomes.get(
+                        (rule, vw, k, hold_bars), ({}, 0.0, 0, {})
                     )
                     results.append(
                         {
                             "rule": rule,
                             "thresh": thresh,
                             "hold_bars": hold_bars,
-                            "vol_weight": None,
+                            "vol_weight": vw,
                             "total_pnl_points": round(total_pnl, 2),
                             "num_trades": num_trades,
                             "daily_pnl": daily,
@@ -395,7 +540,14 @@ def main():
     parser.add_argument(
         "--quick", action="store_true", help="Fewer rule/thresh/hold combos (faster)"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes for the grid search (0 = one per CPU; default 1)",
+    )
     args = parser.parse_args()
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
 
     if not args.exchange:
         args.exchange = ["BSE", "NSE"]
@@ -410,7 +562,7 @@ def main():
     for exchange in args.exchange:
         print(f"========== {exchange} ==========")
         try:
-            results = grid_search(exchange, start_date, end_date, quick=args.quick)
+            results = grid_search(exchange, start_date, end_date, quick=args.quick, workers=workers)
         except Exception as e:
             print(f"  Error: {e}\n")
             continue
@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Equivalence checks for the backtests' and dashboard's fast paths on small synthetic data: each one is
+compared against the plain per-combo Python code it replaces. Exits non-zero on a mismatch.
+
+- Fib: run_all_days_nb (numba when installed) and the vectorized evaluate_all_params grid
+  against a per-combo loop over run_fib_day.
+- OI/Vol: the _simulate_nb / _simulate_into_nb state machine (numba when installed) against
+  _simulate_py.
+- Dashboard: ojson's MessagePack body (Accept: application/msgpack, msgpack when installed)
+  against its JSON body, for a document built by the dashboard's own column helpers.
+- With --db: the psycopg2 and asyncpg (--async) COPY BINARY loaders against plain per-day
+  queries, on synthetic bars written to the OI_TRACKER_DB_* database. It creates
+  multi_resolution_bars and drops it afterwards, so it refuses to run where that table
+  already exists: use a scratch database.
+
+Run from project root (CI runs it with and without requirements-fast.txt installed):
+    python scripts/check_equivalence.py
+    python scripts/check_equivalence.py --db
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import orjson
+import psycopg2
+from psycopg2.extras import execute_values
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import database as db  # noqa: E402
+from scripts import backtest_fib_prev_day as fib  # noqa: E402
+from scripts import oi_volume_dashboard as dashboard  # noqa: E402
+from scripts._backtest_njit import (  # noqa: E402
+    NUMBA_AVAILABLE,
+    _simulate_into_nb,
+    _simulate_nb,
+    _simulate_py,
+    trade_buffers,
+)
+
+# The full grid searched by backtest_fib_prev_day (grid_search_best_intraday)
+ENTRY_RATIOS = (0.382, 0.5, 0.618, 0.786)
+TARGET_RATIOS = (1.11, 1.272)
+STOP_BUFFERS = (10, 15, 20, 25)
+SIDES = ("both", "long_only", "short_only")
+SIDE_CODES = {"long": 1, "short": -1, None: 0}
+
+# hold_bars / min_gap pairs for the OI/Vol state machine (hold_bars 0 = hold until reversal)
+SIMULATE_PARAMS = ((0, 1), (1, 1), (5, 1), (5, 3), (30, 2))
+
+# Synthetic bars for --db: two exchanges, each with a DEC and a JAN future, so the loaders'
+# month-hint symbol picks switch over at the turn of the year
+DB_EXCHANGES = ("NSE", "BSE")
+DB_SYMBOLS = ("NIFTY25DECFUT", "NIFTY26JANFUT")
+DB_START = date(2025, 12, 1)
+DB_END = date(2026, 1, 16)
+BARS_TABLE_SQL = """
+    CREATE TABLE multi_resolution_bars (
+        timestamp TIMESTAMP NOT NULL,
+        exchange TEXT NOT NULL,
+        symbol TEXT,
+        resolution TEXT NOT NULL,
+        open_price NUMERIC,
+        high_price NUMERIC,
+        low_price NUMERIC,
+        close_price NUMERIC
+    )
+"""
+# Row-by-row reference for one picked (symbol, day): prev-day H/L, then the day's bars
+REF_HL_SQL = f"""
+    SELECT MAX(high_price)::float8, MIN(low_price)::float8
+    FROM multi_resolution_bars
+    WHERE exchange = %s AND symbol = %s AND timestamp::date = %s
+      AND {fib.RES_IN_SQL}
+      AND high_price IS NOT NULL AND low_price IS NOT NULL
+"""
+REF_BARS_SQL = f"""
+    SELECT open_price::float8, high_price::float8, low_price::float8, close_price::float8
+    FROM multi_resolution_bars
+    WHERE exchange = %s AND symbol = %s AND timestamp::date = %s
+      AND {fib.RES_IN_SQL}
+      AND open_price IS NOT NULL AND close_price IS NOT NULL
+    ORDER BY timestamp
+"""
+
+
+def synthetic_fib_days(n_days: int, seed: int) -> List[fib.DayData]:
+    """
+    Random-walk days around the previous day's range, so entry levels, targets and stops all
+    get hit. A few bars lack high/low (NaN, as the loader returns them) and one day has a
+    zero range.
+    """
+    rng = np.random.default_rng(seed)
+    days: List[fib.DayData] = []
+    for i in range(n_days):
+        prev_low = 20000.0 + rng.normal(0, 200)
+        prev_high = prev_low if i == 3 else prev_low + rng.uniform(80, 400)
+        span = max(prev_high - prev_low, 100.0)
+        n_bars = int(rng.integers(20, 200))
+        close_a = (
+            prev_low + span * rng.uniform(0.2, 0.8) + np.cumsum(rng.normal(0, span / 40, n_bars))
+        )
+        open_a = np.concatenate(([close_a[0] + rng.normal(0, span / 80)], close_a[:-1]))
+        high_a = np.maximum(open_a, close_a) + np.abs(rng.normal(0, span / 60, n_bars))
+        low_a = np.minimum(open_a, close_a) - np.abs(rng.normal(0, span / 60, n_bars))
+        missing = rng.random(n_bars) < 0.02
+        high_a[missing] = np.nan
+        low_a[missing] = np.nan
+        days.append(
+            (
+                date(2026, 1, 1) + timedelta(days=i),
+                "SYN",
+                prev_high,
+                prev_low,
+                fib.fib_level_array(prev_high, prev_low),
+                open_a,
+                high_a,
+                low_a,
+                close_a,
+            )
+        )
+    return days
+
+
+def check_fib(days: List[fib.DayData]) -> List[str]:
+    """Compare run_all_days_nb and evaluate_all_params with run_fib_day for every combo."""
+    failures = []
+    grid = fib.evaluate_all_params(days, ENTRY_RATIOS, TARGET_RATIOS, STOP_BUFFERS, SIDES)
+    packed = fib.pack_days(days)
+    axes = (ENTRY_RATIOS, TARGET_RATIOS, STOP_BUFFERS, SIDES)
+    for idx in np.ndindex(grid.shape):
+        entry, target, stop, sides = (axis[i] for axis, i in zip(axes, idx))
+        expected = [
+            fib.run_fib_day(*day[5:], day[4], stop, entry, target, sides)[:2] for day in days
+        ]
+        # Summed day by day in order, as backtest_exchange does
+        total = sum(pnl for pnl, _ in expected)
+        combo = f"entry={entry} target={target} stop={stop} sides={sides}"
+        if grid[idx] != total:
+            failures.append(f"evaluate_all_params {combo}: {float(grid[idx])!r} != {total!r}")
+
+        above_idx, below_idx = fib.TARGET_EXT_INDEX[target]
+        pnl_a, side_a = fib.run_all_days_nb(
+            *packed,
+            fib.ENTRY_RATIO_INDEX[entry],
+            above_idx,
+            below_idx,
+            float(stop),
+            sides in ("both", "long_only"),
+            sides in ("both", "short_only"),
+        )
+        for day, (pnl, side), got_pnl, got_side in zip(days, expected, pnl_a, side_a):
+            if got_pnl != pnl or got_side != SIDE_CODES[side]:
+                failures.append(
+                    f"run_all_days_nb {combo} {day[0]}: ({float(got_pnl)!r}, {got_side}) != ({pnl!r}, {side})"
+                )
+    return failures
+
+
+def check_simulate(n_days: int, seed: int) -> List[str]:
+    """Compare _simulate_nb and _simulate_into_nb with _simulate_py on random signal days."""
+    rng = np.random.default_rng(seed)
+    failures = []
+    for day in range(n_days):
+        n_bars = int(rng.integers(2, 300))
+        close_p = 20000.0 + np.cumsum(rng.normal(0, 5, n_bars))
+        open_p = close_p + rng.normal(0, 2, n_bars)
+        # Sparse signals, as the OI/Vol crossovers produce
+        sig = rng.choice(np.array([-1, 0, 1], dtype=np.int8), n_bars, p=[0.05, 0.9, 0.05])
+        out = trade_buffers(n_bars)
+        for hold_bars, min_gap in SIMULATE_PARAMS:
+            expected = _simulate_py(open_p, close_p, sig, hold_bars, min_gap)
+            got = _simulate_nb(open_p, close_p, sig, hold_bars, min_gap)
+            total, n_trades = _simulate_into_nb(open_p, close_p, sig, hold_bars, min_gap, *out)
+            got_into = (total, n_trades, *(buf[:n_trades] for buf in out))
+            case = f"day {day} bars={n_bars} hold_bars={hold_bars} min_gap={min_gap}"
+            for name, result in (("_simulate_nb", got), ("_simulate_into_nb", got_into)):
+                if (
+                    result[0] != expected[0]
+                    or result[1] != expected[1]
+                    or not all(np.array_equal(a, b) for a, b in zip(result[2:], expected[2:]))
+                ):
+                    failures.append(
+                        f"{name} {case}: total {float(result[0])!r} ({result[1]} trades)"
+                        f" != {expected[0]!r} ({expected[1]} trades)"
+                    )
+    return failures
+
+
+def synthetic_dashboard_doc(seed: int) -> Dict[str, Any]:
+    """
+    A /api/dashboard-shaped document from _columns and _concat_columns: float columns with
+    NULLs (NaN), int columns as int64 arrays or, when they hold a NULL, lists with None,
+    empty columns, and trade rows of plain Python values.
+    """
+    rng = np.random.default_rng(seed)
+    session = datetime(2026, 1, 5, 9, 15)
+
+    def rows(n: int, n_values: int, null_rate: float) -> List[tuple]:
+        return [
+            (
+                session + timedelta(minutes=i),
+                *(
+                    None if rng.random() < null_rate else round(float(rng.normal(100, 30)), 2)
+                    for _ in range(n_values)
+                ),
+            )
+            for i in range(n)
+        ]
+
+    bar_chunks = [
+        dashboard._columns(
+            [(*row[:5], *(None if v is None else int(v) for v in row[5:])) for row in chunk],
+            dashboard.BAR_FIELDS,
+        )
+        for chunk in (rows(40, 6, 0.0), rows(40, 6, 0.05), [])
+    ]
+    return {
+        "bars": {
+            name: dashboard._concat_columns(bar_chunks, name) for name in dashboard.BAR_FIELDS
+        },
+        "bars_no_nulls": dashboard._columns(
+            [(*row[:5], 7, 2**40) for row in rows(10, 4, 0.0)], dashboard.BAR_FIELDS
+        ),
+        "oi_vol": {
+            "exchange": "NSE",
+            "points": dashboard._columns(rows(60, 4, 0.1), dashboard.OI_VOL_FIELDS),
+            "empty": dashboard._columns([], dashboard.OI_VOL_FIELDS),
+        },
+        "trades": [
+            {"side": "BUY", "entry_time": 1767585300, "pnl": -12.5, "exit_price": None},
+            {"side": "SELL", "entry_time": 1767585360, "pnl": 0.0, "trades": 3},
+        ],
+    }
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    """Structural equality that also tells int from float (1 == 1.0 in Python)."""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same_value(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same_value(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def check_msgpack(seed: int) -> List[str]:
+    """Compare ojson's MessagePack and JSON bodies for the same document, decoded."""
+    if not dashboard.MSGPACK_AVAILABLE:
+        return []
+    import msgpack
+
+    doc = synthetic_dashboard_doc(seed)
+    with dashboard.app.test_request_context(headers={"Accept": dashboard.MSGPACK_MIMETYPE}):
+        packed = dashboard.ojson(doc)
+    with dashboard.app.test_request_context():
+        plain = dashboard.ojson(doc)
+
+    failures = []
+    if packed.mimetype != dashboard.MSGPACK_MIMETYPE:
+        failures.append(f"ojson with Accept msgpack: mimetype {packed.mimetype}")
+    expected = orjson.loads(plain.get_data())
+    got = msgpack.unpackb(packed.get_data(), raw=False)
+    for key in expected:
+        if not _same_value(got.get(key), expected[key]):
+            failures.append(f"ojson msgpack body differs from JSON under {key!r}")
+    if got.keys() != expected.keys():
+        failures.append(f"ojson msgpack keys {sorted(got)} != {sorted(expected)}")
+    return failures
+
+
+def synthetic_bar_rows(seed: int) -> List[Tuple]:
+    """
+    multi_resolution_bars rows: weekday sessions of minute bars under a mix of the resolution
+    spellings the loaders accept, plus daily bars they must skip. Some bars lack a price, as
+    live data does.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for exchange in DB_EXCHANGES:
+        for symbol in DB_SYMBOLS:
+            price = 24000.0
+            for ordinal in range(DB_START.toordinal() - 3, DB_END.toordinal() + 1):
+                d = date.fromordinal(ordinal)
+                if d.weekday() >= 5:
+                    continue
+                session = datetime.combine(d, datetime.min.time()) + timedelta(hours=9, minutes=15)
+                for minute in range(75):
+                    open_p = price
+                    price += rng.normal(0, 8)
+                    prices = [
+                        open_p,
+                        max(open_p, price) + abs(rng.normal(0, 4)),
+                        min(open_p, price) - abs(rng.normal(0, 4)),
+                        price,
+                    ]
+                    if rng.random() < 0.03:
+                        prices[int(rng.integers(0, 4))] = None
+                    resolution = str(rng.choice(["1m", "1", "1min"]))
+                    rows.append(
+                        (session + timedelta(minutes=minute), exchange, symbol, resolution, *prices)
+                    )
+                rows.append(
+                    (session, exchange, symbol, "1D", price, price + 500, price - 500, price)
+                )
+    return rows
+
+
+def _same_day(a: fib.DayData, b: fib.DayData) -> bool:
+    """Exact match, NaN included (arrays compared byte for byte)."""
+    return a[:4] == b[:4] and all(
+        x.dtype == y.dtype and x.tobytes() == y.tobytes() for x, y in zip(a[4:], b[4:])
+    )
+
+
+def reference_days(cur: Any, exchange: str) -> List[fib.DayData]:
+    """load_all_days_data the slow way: two plain queries per picked day, NULL prices as NaN."""
+    start_dt = datetime.combine(DB_START, datetime.min.time())
+    end_dt = datetime.combine(DB_END + timedelta(days=30), datetime.min.time())
+    cur.execute(fib.COVERAGE_SQL, (exchange, start_dt, end_dt))
+    coverage = [tuple(row) for row in cur.fetchall()]
+    days: List[fib.DayData] = []
+    for d, symbol in fib._pick_days(exchange, DB_START, DB_END, coverage):
+        cur.execute(REF_HL_SQL, (exchange, symbol, d - timedelta(days=1)))
+        prev_high, prev_low = cur.fetchone()
+        cur.execute(REF_BARS_SQL, (exchange, symbol, d))
+        rows = cur.fetchall()
+        if prev_high is None or not rows:
+            continue
+        bars = np.array(rows, dtype=np.float64)  # None -> NaN
+        days.append(
+            (
+                d,
+                symbol,
+                prev_high,
+                prev_low,
+                fib.fib_level_array(prev_high, prev_low),
+                *(np.ascontiguousarray(bars[:, i]) for i in range(4)),
+            )
+        )
+    return days
+
+
+def check_loaders(seed: int) -> List[str]:
+    """
+    Load synthetic bars with load_all_days_data (psycopg2) and load_exchanges_async (asyncpg)
+    and compare both with reference_days exactly.
+    """
+    conn = psycopg2.connect(options=db.SESSION_OPTIONS, **db._connect_params())
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            if db.has_table(cur, "multi_resolution_bars"):
+                sys.exit(
+                    f"--db: multi_resolution_bars already exists in {conn.info.dbname};"
+                    " point OI_TRACKER_DB_NAME at a scratch database"
+                )
+            cur.execute(BARS_TABLE_SQL)
+            try:
+                execute_values(
+                    cur,
+                    "INSERT INTO multi_resolution_bars VALUES %s",
+                    synthetic_bar_rows(seed),
+                    page_size=5000,
+                )
+                ref_days = {ex: reference_days(cur, ex) for ex in DB_EXCHANGES}
+                sync_days = {
+                    ex: fib.load_all_days_data(ex, DB_START, DB_END) for ex in DB_EXCHANGES
+                }
+                async_days = asyncio.run(
+                    fib.load_exchanges_async(list(DB_EXCHANGES), DB_START, DB_END)
+                )
+            finally:
+                if db.pg_pool is not None:
+                    db.pg_pool.closeall()
+                    db.pg_pool = None
+                cur.execute("DROP TABLE multi_resolution_bars")
+    finally:
+        conn.close()
+
+    failures = []
+    for exchange in DB_EXCHANGES:
+        expected = ref_days[exchange]
+        if not expected:
+            failures.append(f"reference {exchange}: no days loaded")
+        for name, got in (
+            ("load_all_days_data", sync_days[exchange]),
+            ("load_all_days_data_async", async_days[exchange]),
+        ):
+            if isinstance(got, Exception):
+                failures.append(f"{name} {exchange}: raised {got!r}")
+            elif len(got) != len(expected):
+                failures.append(f"{name} {exchange}: {len(got)} days != {len(expected)}")
+            else:
+                failures.extend(
+                    f"{name} {exchange} {b[0]} {b[1]}: day data differs"
+                    for a, b in zip(got, expected)
+                    if not _same_day(a, b)
+                )
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check the backtests' fast paths against plain Python"
+    )
+    parser.add_argument(
+        "--days", type=int, default=40, help="Synthetic days per check (default 40)"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for the synthetic data")
+    parser.add_argument(
+        "--db",
+        action="store_true",
+        help="Also compare the sync and asyncpg bar loaders (needs a scratch database)",
+    )
+    args = parser.parse_args()
+
+    print(f"numba: {'yes' if NUMBA_AVAILABLE else 'no (pure-Python fallbacks)'}")
+    failures = check_fib(synthetic_fib_days(args.days, args.seed))
+    n_combos = len(ENTRY_RATIOS) * len(TARGET_RATIOS) * len(STOP_BUFFERS) * len(SIDES)
+    print(f"fib: {n_combos} combos x {args.days} days, {len(failures)} mismatches")
+    simulate_failures = check_simulate(args.days, args.seed)
+    print(
+        f"oi_vol: {len(SIMULATE_PARAMS)} hold/gap pairs x {args.days} days,"
+        f" {len(simulate_failures)} mismatches"
+    )
+    failures += simulate_failures
+    msgpack_failures = check_msgpack(args.seed)
+    print(
+        f"msgpack: {len(msgpack_failures)} mismatches"
+        if dashboard.MSGPACK_AVAILABLE
+        else "msgpack: not installed, skipped"
+    )
+    failures += msgpack_failures
+    if args.db:
+        loader_failures = check_loaders(args.seed)
+        print(
+            f"loaders: sync and asyncpg vs per-day queries over {', '.join(DB_EXCHANGES)}, {len(loader_failures)} mismatches"
+        )
+        failures += loader_failures
+
+    for line in failures[:20]:
+        print(f"  {line}")
+    if failures:
+        sys.exit(1)
+    print("All checks passed.")
+
+
+if __name__ == "__main__":
+    main()
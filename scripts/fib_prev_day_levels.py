@@ -18,6 +18,8 @@ import sys
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
+import numpy as np
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
@@ -25,27 +27,28 @@ if str(PROJECT_ROOT) not in sys.path:
 # Standard Fib ratios (retracements between 0 and 1; extensions above/below)
 RETRACEMENT_RATIOS = (0.27, 0.382, 0.5, 0.618, 0.786)
 EXTENSION_RATIOS = (1.11, 1.272, 1.618, 2.618, 3.618, 4.236)
+_RET = np.array(RETRACEMENT_RATIOS)
+_EXT_OFFSET = np.array(EXTENSION_RATIOS) - 1
+
+# Resolutions for prev-day bars (1m or 5m), inlined as a literal IN list: it is constant, so
+# there is nothing to bind per call
+RES_VARIANTS = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE", "5", "5m", "5min")
+RES_IN_SQL = "resolution IN (" + ", ".join(f"'{r}'" for r in RES_VARIANTS) + ")"
 
 
 def fib_levels(high: float, low: float) -> dict:
-    """Compute retracement and extension levels. Low = 0, High = 1."""
+    """
+    Compute retracement and extension levels. Low = 0, High = 1.
+    Level arrays line up with RETRACEMENT_RATIOS / EXTENSION_RATIOS.
+    """
     r = high - low
-    retracements = {}
-    for ratio in RETRACEMENT_RATIOS:
-        retracements[ratio] = round(low + r * ratio, 2)
-    extensions_above = {}
-    for ratio in EXTENSION_RATIOS:
-        extensions_above[ratio] = round(high + r * (ratio - 1), 2)
-    extensions_below = {}
-    for ratio in EXTENSION_RATIOS:
-        extensions_below[ratio] = round(low - r * (ratio - 1), 2)
     return {
         "high": high,
         "low": low,
         "range": round(r, 2),
-        "retracements": retracements,
-        "extensions_above": extensions_above,
-        "extensions_below": extensions_below,
+        "retracements": np.round(low + r * _RET, 2),
+        "extensions_above": np.round(high + r * _EXT_OFFSET, 2),
+        "extensions_below": np.round(low - r * _EXT_OFFSET, 2),
     }
 
 
@@ -59,37 +62,31 @@ def get_prev_day_high_low_from_db(
         import database as db
     except ImportError:
         return None
-    if not hasattr(db, "get_db_connection"):
+    if not hasattr(db, "db_cursor"):
         return None
     # Previous calendar day (no holiday calendar; can be improved)
     prev = as_of_date - timedelta(days=1)
     start_dt = datetime.combine(prev, datetime.min.time())
     end_dt = datetime.combine(prev + timedelta(days=1), datetime.min.time())
-    res_variants = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE", "5", "5m", "5min")
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        SELECT high_price, low_price
-        FROM multi_resolution_bars
-        WHERE exchange = %s
-          AND symbol = %s
-          AND timestamp >= %s
-          AND timestamp < %s
-          AND resolution = ANY(%s)
-        """,
-        (exchange, symbol, start_dt, end_dt, list(res_variants)),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-    if not rows:
-        return None
-    valid = [r for r in rows if r[0] is not None and r[1] is not None]
-    if not valid:
+    with db.db_cursor() as cur:
+        cur.execute(
+            f"""
+            SELECT MAX(high_price), MIN(low_price)
+            FROM multi_resolution_bars
+            WHERE exchange = %s
+              AND symbol = %s
+              AND timestamp >= %s
+              AND timestamp < %s
+              AND {RES_IN_SQL}
+              AND high_price IS NOT NULL
+              AND low_price IS NOT NULL
+            """,
+            (exchange, symbol, start_dt, end_dt),
+        )
+        high, low = cur.fetchone()
+    if high is None or low is None:
         return None
-    high = max(float(r[0]) for r in valid)
-    low = min(float(r[1]) for r in valid)
-    return (high, low, prev)
+    return (float(high), float(low), prev)
 
 
 def main() -> None:
@@ -152,16 +149,16 @@ def main() -> None:
     print("Anchor:  Low (0) =", levels["low"], "  High (1) =", levels["high"])
     print()
     print("Retracements (between low and high):")
-    for r in RETRACEMENT_RATIOS:
-        print(f"  {r:.3f}  {levels['retracements'][r]}")
+    for r, level in zip(RETRACEMENT_RATIOS, levels["retracements"].tolist()):
+        print(f"  {r:.3f}  {level}")
     print()
     print("Extensions above high:")
-    for r in EXTENSION_RATIOS:
-        print(f"  {r:.3f}  {levels['extensions_above'][r]}")
+    for r, level in zip(EXTENSION_RATIOS, levels["extensions_above"].tolist()):
+        print(f"  {r:.3f}  {level}")
     print()
     print("Extensions below low:")
-    for r in EXTENSION_RATIOS:
-        print(f"  {r:.3f}  {levels['extensions_below'][r]}")
+    for r, level in zip(EXTENSION_RATIOS, levels["extensions_below"].tolist()):
+        print(f"  {r:.3f}  {level}")
 
 
 if __name__ == "__main__":
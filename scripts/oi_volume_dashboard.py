@@ -11,6 +11,8 @@ Features:
 
 Run from project root:
     python scripts/oi_volume_dashboard.py
+or, to serve several users (see gunicorn.conf.py):
+    gunicorn oi_volume_dashboard:app
 
 Then open in browser:
     http://127.0.0.1:7000/
@@ -18,14 +20,30 @@ Then open in browser:
 
 from __future__ import annotations
 
-import json
+import calendar
+import functools
+import gzip
+import hashlib
 import os
 import sys
-from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from time import monotonic
+from typing import Any, Callable, Dict, List
 
-from flask import Flask, Response, jsonify, request
+import numpy as np
+import orjson
+from flask import Flask, Response, request
+from flask_caching import Cache
+from flask_compress import Compress
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 # Project root = OI_Dashboard (parent of scripts/)
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -36,25 +54,219 @@ import database as db  # noqa: E402
 
 app = Flask(__name__)
 
-try:
-    from zoneinfo import ZoneInfo
+# Compress API responses above 1 KiB (brotli when the client accepts it, else gzip); the
+# index page is gzipped once at import and is left alone (it already has Content-Encoding)
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_MIN_SIZE"] = 1024
+app.config["COMPRESS_MIMETYPES"] = ["application/json", "application/msgpack"]
+Compress(app)
+
+# Response cache for the read endpoints; SimpleCache is per process, set
+# OI_DASHBOARD_CACHE_TYPE=RedisCache (plus CACHE_REDIS_URL) to share it between workers
+cache = Cache(
+    app,
+    config={
+        "CACHE_TYPE": os.getenv("OI_DASHBOARD_CACHE_TYPE", "SimpleCache"),
+        "CACHE_REDIS_URL": os.getenv("CACHE_REDIS_URL", ""),
+    },
+)
+# Seconds to cache a response whose range reaches today (data still arriving) / ends before today
+CACHE_TTL_LIVE = 30
+CACHE_TTL_HISTORICAL = 3600
+
+# Resolutions treated as 1m, inlined as a literal IN list: a subset of the
+# database.HOT_BARS_INDEX_SQL partial-index predicate, so the planner can use that index
+RES_VARIANTS = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE")
+RES_IN_SQL = "resolution IN (" + ", ".join(f"'{r}'" for r in RES_VARIANTS) + ")"
+
+# Fixed-shape queries run through db.execute_prepared ($1 exchange, $2 start, $3 end): each
+# pooled connection parses and plans them once. Volume % change lives in feature_payload;
+# it is extracted in SQL so only floats cross the wire (bad JSON and non-numeric values become NULL).
+ITM_OI_VOLUME_SQL = f"""
+    SELECT
+        timestamp,
+        itm_oi_ce_pct_change_3m_wavg::float8 AS ce_oi_pct,
+        itm_oi_pe_pct_change_3m_wavg::float8 AS pe_oi_pct,
+        {db.json_float_sql("feature_payload", "itm_volume_ce_pct_change_3m_wavg")} AS ce_vol_pct,
+        {db.json_float_sql("feature_payload", "itm_volume_pe_pct_change_3m_wavg")} AS pe_vol_pct
+    FROM ml_features
+    WHERE exchange = $1
+      AND timestamp >= $2
+      AND timestamp < $3
+    ORDER BY timestamp
+"""
+BUSIEST_SYMBOL_SQL = f"""
+    SELECT symbol, COUNT(*) AS c
+    FROM multi_resolution_bars
+    WHERE exchange = $1
+      AND timestamp >= $2
+      AND timestamp < $3
+      AND {RES_IN_SQL}
+      AND symbol IS NOT NULL
+    GROUP BY symbol
+    ORDER BY c DESC
+    LIMIT 1
+"""
+SYMBOLS_SQL = f"""
+    SELECT symbol, COUNT(*) AS bar_count
+    FROM multi_resolution_bars
+    WHERE exchange = $1
+      AND timestamp >= $2
+      AND timestamp < $3
+      AND {RES_IN_SQL}
+      AND symbol IS NOT NULL
+    GROUP BY symbol
+    ORDER BY bar_count DESC, symbol ASC
+    LIMIT 100
+"""
+# Same two lookups answered from database.SYMBOL_COUNTS_TABLE_SQL's per-day rollup
+# ($2 / $3 are the first and last trade dates)
+BUSIEST_SYMBOL_DAILY_SQL = f"""
+    SELECT symbol, SUM(bar_count)::int8 AS c
+    FROM daily_symbol_bar_count
+    WHERE exchange = $1
+      AND trade_date BETWEEN $2 AND $3
+      AND {RES_IN_SQL}
+    GROUP BY symbol
+    ORDER BY c DESC
+    LIMIT 1
+"""
+SYMBOLS_DAILY_SQL = f"""
+    SELECT symbol, SUM(bar_count)::int8 AS bar_count
+    FROM daily_symbol_bar_count
+    WHERE exchange = $1
+      AND trade_date BETWEEN $2 AND $3
+      AND {RES_IN_SQL}
+    GROUP BY symbol
+    ORDER BY bar_count DESC, symbol ASC
+    LIMIT 100
+"""
+
+# Rows per server-side cursor fetch when loading /api/bars_1m
+BARS_STREAM_BATCH = 1000
+
+# Column names of the columnar "points" / "bars" payloads, in query column order
+OI_VOL_FIELDS = ("time", "ce_oi_pct", "pe_oi_pct", "ce_vol_pct", "pe_vol_pct")
+BAR_FIELDS = ("time", "open", "high", "low", "close", "volume", "oi")
+# Columns the queries cast to int8: kept as integers (the others are float8)
+INT_FIELDS = frozenset({"volume", "oi"})
+
+# Runs the three lookups of /api/dashboard side by side (shared by all requests). Each lookup
+# holds one pooled connection at a time, so capping the workers at the pool size keeps the
+# executor from queueing on the pool; the pool itself makes any excess wait, not fail.
+_dashboard_executor = ThreadPoolExecutor(
+    max_workers=min(int(os.getenv("OI_DASHBOARD_WORKERS", "6")), db.pool_max_size())
+)
+
+# Time of day for datetime.combine(day, _MIDNIGHT), built once instead of per request
+_MIDNIGHT = time(0, 0)
+
+# Naive DB timestamps are IST; UTC+5:30 has no DST, so a fixed offset converts them
+IST_OFFSET_SECONDS = 5 * 3600 + 30 * 60
+
+
+MSGPACK_MIMETYPE = "application/msgpack"
+
+
+def _wants_msgpack() -> bool:
+    """True if the request sent Accept: application/msgpack and msgpack is installed."""
+    return MSGPACK_AVAILABLE and MSGPACK_MIMETYPE in request.headers.get("Accept", "")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """msgpack hook for NumPy columns: float NaN -> None, matching the JSON null."""
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.kind == "f":
+            return [None if v != v else v for v in obj.tolist()]
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
 
-    IST = ZoneInfo("Asia/Kolkata")
-except Exception:
-    IST = None
+def ojson(data: Any) -> Response:
+    """
+    JSON response serialized with orjson (much faster than jsonify on large point lists).
+    NumPy arrays are written straight from their buffers; NaN becomes null. Clients that
+    send Accept: application/msgpack get the same document as MessagePack instead.
+    """
+    if _wants_msgpack():
+        body = msgpack.packb(data, default=_msgpack_default, use_bin_type=True)
+        return Response(body, mimetype=MSGPACK_MIMETYPE)
+    body = orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return Response(body, mimetype="application/json")
+
+
+def cached_json(view: Callable[[], Response]) -> Callable[[], Response]:
+    """
+    Cache a JSON endpoint's body keyed by path + full query string (exchange, start, end,
+    symbol, outcome, limit) and response format. Ranges ending before today are immutable
+    and kept longer.
+    """
 
+    @functools.wraps(view)
+    def wrapper() -> Response:
+        key = ("msgpack:" if _wants_msgpack() else "view:") + request.full_path
+        cached = cache.get(key)
+        if cached is None:
+            resp = view()
+            cached = (resp.mimetype, resp.get_data())
+            today = datetime.utcnow().date()
+            historical = _parse_date(request.args.get("end", ""), today) < today
+            cache.set(key, cached, timeout=CACHE_TTL_HISTORICAL if historical else CACHE_TTL_LIVE)
+        mimetype, body = cached
+        return Response(body, mimetype=mimetype, headers={"Vary": "Accept"})
 
-def _to_utc_epoch_seconds(ts: datetime) -> int:
+    return wrapper
+
+
+def _to_utc_epoch_seconds(ts: datetime, _timegm=calendar.timegm) -> int:
     if ts is None:
         return 0
     if ts.tzinfo is None:
-        if IST is not None:
-            ts = ts.replace(tzinfo=IST).astimezone(timezone.utc)
+        return _timegm(ts.timetuple()) - IST_OFFSET_SECONDS
+    return _timegm(ts.utctimetuple())
+
+
+def _epoch_column(stamps: tuple, _epoch=_to_utc_epoch_seconds) -> np.ndarray:
+    """Timestamps -> int64 UTC epoch seconds (same values as _to_utc_epoch_seconds)."""
+    # A column is all naive or all aware; the queries filter on timestamp, so none are NULL
+    if stamps and stamps[0].tzinfo is None:
+        # Naive IST timestamps: one datetime64 conversion and a vector subtract
+        micros = np.array(stamps, dtype="datetime64[us]").astype(np.int64)
+        return micros // 1_000_000 - IST_OFFSET_SECONDS
+    return np.fromiter((_epoch(ts) for ts in stamps), dtype=np.int64, count=len(stamps))
+
+
+def _columns(rows: List[tuple], fields: tuple) -> Dict[str, Any]:
+    """
+    (timestamp, value, ...) rows -> {fields[0]: int64 epoch seconds, other fields: column}.
+    Queries cast values to float8/int8, so NULLs are the only non-numbers. Float columns are
+    float64 arrays with NULL as NaN (written as null); INT_FIELDS columns are int64 arrays,
+    or plain lists of int/None when they hold a NULL, so integers stay integers.
+    """
+    if not rows:
+        return {
+            name: np.empty(0, dtype=np.int64 if i == 0 or name in INT_FIELDS else np.float64)
+            for i, name in enumerate(fields)
+        }
+    # zip(*rows) transposes in C
+    stamps, *values = zip(*rows)
+    cols = {fields[0]: _epoch_column(stamps)}
+    for name, column in zip(fields[1:], values):
+        if name not in INT_FIELDS:
+            cols[name] = np.array(column, dtype=np.float64)
+        elif None in column:
+            cols[name] = list(column)
         else:
-            ts = ts.replace(tzinfo=timezone.utc)
-    else:
-        ts = ts.astimezone(timezone.utc)
-    return int(ts.timestamp())
+            cols[name] = np.array(column, dtype=np.int64)
+    return cols
+
+
+def _concat_columns(chunks: List[Dict[str, Any]], name: str) -> Any:
+    """Join one _columns field across chunks; a list in any chunk makes the result a list."""
+    parts = [c[name] for c in chunks]
+    if any(isinstance(p, list) for p in parts):
+        return [v for p in parts for v in (p if isinstance(p, list) else p.tolist())]
+    return np.concatenate(parts)
 
 
 def _parse_date(s: str, default: date) -> date:
@@ -71,7 +283,60 @@ def _parse_int(s: str, default: int) -> int:
         return default
 
 
+# Seconds before re-checking whether the daily_symbol_bar_count rollup exists, so one created
+# (or dropped) while the dashboard runs is picked up without a restart
+SYMBOL_COUNTS_RECHECK_SECONDS = 300
+# (monotonic time of the last check, whether the rollup existed); None until the first lookup
+_symbol_counts_checked = None
+
+
+def _has_symbol_counts(cur) -> bool:
+    """
+    True if the daily_symbol_bar_count rollup exists (re-checked every
+    SYMBOL_COUNTS_RECHECK_SECONDS). The check runs on the caller's cursor: taking a second
+    pooled connection while cur's is held could leave every executor thread waiting on the
+    pool for one.
+    """
+    global _symbol_counts_checked
+    checked, now = _symbol_counts_checked, monotonic()
+    if checked is None or now - checked[0] >= SYMBOL_COUNTS_RECHECK_SECONDS:
+        checked = _symbol_counts_checked = (now, db.has_table(cur, "daily_symbol_bar_count"))
+    return checked[1]
+
+
+def _execute_symbol_counts(cur, name: str, exchange: str, start_date: date, end_date: date):
+    """Run the "symbols" or "busiest_symbol" lookup, from the daily rollup when available."""
+    if _has_symbol_counts(cur):
+        sql = SYMBOLS_DAILY_SQL if name == "symbols" else BUSIEST_SYMBOL_DAILY_SQL
+        db.execute_prepared(cur, f"{name}_daily_q", sql, (exchange, start_date, end_date))
+    else:
+        # Sessions run in database.TRADE_TIMEZONE, the zone the rollup buckets trade_date
+        # in, so this range covers the same days either way
+        sql = SYMBOLS_SQL if name == "symbols" else BUSIEST_SYMBOL_SQL
+        start_dt = datetime.combine(start_date, _MIDNIGHT)
+        end_dt = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
+        db.execute_prepared(cur, f"{name}_q", sql, (exchange, start_dt, end_dt))
+
+
+def _oi_vol_payload(exchange: str, start_date: date, end_date: date) -> Dict[str, Any]:
+    """api_itm_oi_volume document: ITM CE/PE OI% and Volume% columns for the date range."""
+    start_dt = datetime.combine(start_date, _MIDNIGHT)
+    end_dt = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
+
+    with db.db_cursor() as cur:
+        db.execute_prepared(cur, "itm_oi_volume_q", ITM_OI_VOLUME_SQL, (exchange, start_dt, end_dt))
+        rows = cur.fetchall()
+
+    return {
+        "exchange": exchange,
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "points": _columns(rows, OI_VOL_FIELDS),
+    }
+
+
 @app.route("/api/itm_oi_volume")
+@cached_json
 def api_itm_oi_volume() -> Response:
     """Return ITM CE/PE OI% and Volume% time series for given exchange and date range."""
     exchange = request.args.get("exchange", "NSE").upper()
@@ -79,65 +344,69 @@ def api_itm_oi_volume() -> Response:
     default_start = today - timedelta(days=5)
     start_date = _parse_date(request.args.get("start", ""), default_start)
     end_date = _parse_date(request.args.get("end", ""), today)
+    return ojson(_oi_vol_payload(exchange, start_date, end_date))
 
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
 
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-
-    query = """
-        SELECT
-            timestamp,
-            itm_oi_ce_pct_change_3m_wavg AS ce_oi_pct,
-            itm_oi_pe_pct_change_3m_wavg AS pe_oi_pct,
-            feature_payload
-        FROM ml_features
-        WHERE exchange = %s
-          AND timestamp >= %s
-          AND timestamp < %s
-        ORDER BY timestamp
+def _bars_payload(
+    exchange: str, symbol: str, start_date: date, end_date: date, limit: int
+) -> Dict[str, Any]:
     """
-    cur.execute(query, (exchange, start_dt, end_dt))
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-
-    points: List[Dict[str, Any]] = []
-    for ts, ce_oi, pe_oi, payload in rows:
-        ce_vol = None
-        pe_vol = None
-        if payload:
-            try:
-                if isinstance(payload, str):
-                    payload = json.loads(payload)
-                if isinstance(payload, dict):
-                    ce_vol = payload.get("itm_volume_ce_pct_change_3m_wavg")
-                    pe_vol = payload.get("itm_volume_pe_pct_change_3m_wavg")
-            except Exception:
-                pass
-
-        t = _to_utc_epoch_seconds(ts)
-        points.append(
-            {
-                "time": t,
-                "ce_oi_pct": float(ce_oi) if ce_oi is not None else None,
-                "pe_oi_pct": float(pe_oi) if pe_oi is not None else None,
-                "ce_vol_pct": float(ce_vol) if ce_vol is not None else None,
-                "pe_vol_pct": float(pe_vol) if pe_vol is not None else None,
-            }
-        )
+    api_bars_1m document: the latest limit 1m OHLCV + OI bars (ascending) for symbol, or for
+    the symbol with the most bars in the range when symbol is empty.
+    """
+    start_dt = datetime.combine(start_date, _MIDNIGHT)
+    end_dt = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
 
-    return jsonify(
-        {
-            "exchange": exchange,
-            "start": start_date.isoformat(),
-            "end": end_date.isoformat(),
-            "points": points,
-        }
-    )
+    chosen_symbol = symbol
+    if not chosen_symbol:
+        with db.db_cursor() as cur:
+            _execute_symbol_counts(cur, "busiest_symbol", exchange, start_date, end_date)
+            row = cur.fetchone()
+        if row and row[0]:
+            chosen_symbol = row[0]
+
+    chunks = []
+    if chosen_symbol:
+        with db.db_cursor(name="bars_stream") as cur:
+            cur.itersize = BARS_STREAM_BATCH
+            cur.execute(
+                f"""
+                SELECT
+                  timestamp,
+                  open_price::float8, high_price::float8, low_price::float8, close_price::float8,
+                  volume::int8, oi::int8
+                FROM multi_resolution_bars
+                WHERE exchange = %s
+                  AND symbol = %s
+                  AND timestamp >= %s
+                  AND timestamp < %s
+                  AND {RES_IN_SQL}
+                ORDER BY timestamp DESC
+                LIMIT %s
+                """,
+                (exchange, chosen_symbol, start_dt, end_dt, limit),
+            )
+            # Each fetched batch becomes arrays straight away, so at most one batch of row
+            # tuples is alive at a time
+            while batch := cur.fetchmany(BARS_STREAM_BATCH):
+                chunks.append(_columns(batch, BAR_FIELDS))
+    if not chunks:
+        chunks.append(_columns([], BAR_FIELDS))
+    # Newest-first from a backward index scan (so LIMIT keeps the latest bars); reversed into
+    # the ascending order the chart needs, copied to stay contiguous for orjson
+    bars = {name: _concat_columns(chunks, name)[::-1].copy() for name in BAR_FIELDS}
+
+    return {
+        "exchange": exchange,
+        "symbol": chosen_symbol,
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "bars": bars,
+    }
 
 
 @app.route("/api/bars_1m")
+@cached_json
 def api_bars_1m() -> Response:
     """Return 1-minute OHLCV (and OI) bars from multi_resolution_bars for a symbol."""
     exchange = request.args.get("exchange", "NSE").upper()
@@ -147,103 +416,19 @@ def api_bars_1m() -> Response:
     start_date = _parse_date(request.args.get("start", ""), default_start)
     end_date = _parse_date(request.args.get("end", ""), today)
     limit = _parse_int(request.args.get("limit", ""), 5000)
-
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-
-    res_variants = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE")
-
-    chosen_symbol = symbol
-    if not chosen_symbol:
-        cur.execute(
-            """
-            SELECT symbol, COUNT(*) AS c
-            FROM multi_resolution_bars
-            WHERE exchange = %s
-              AND timestamp >= %s
-              AND timestamp < %s
-              AND resolution = ANY(%s)
-              AND symbol IS NOT NULL
-            GROUP BY symbol
-            ORDER BY c DESC
-            LIMIT 1
-            """,
-            (exchange, start_dt, end_dt, list(res_variants)),
-        )
-        row = cur.fetchone()
-        if row and row[0]:
-            chosen_symbol = row[0]
-
-    bars: List[Dict[str, Any]] = []
-    if chosen_symbol:
-        cur.execute(
-            """
-            SELECT
-              timestamp,
-              open_price, high_price, low_price, close_price,
-              volume, oi
-            FROM multi_resolution_bars
-            WHERE exchange = %s
-              AND symbol = %s
-              AND timestamp >= %s
-              AND timestamp < %s
-              AND resolution = ANY(%s)
-            ORDER BY timestamp
-            LIMIT %s
-            """,
-            (exchange, chosen_symbol, start_dt, end_dt, list(res_variants), limit),
-        )
-        rows = cur.fetchall()
-        for ts, o, h, low, c, v, oi in rows:
-            bars.append(
-                {
-                    "time": _to_utc_epoch_seconds(ts),
-                    "open": float(o) if o is not None else None,
-                    "high": float(h) if h is not None else None,
-                    "low": float(low) if low is not None else None,
-                    "close": float(c) if c is not None else None,
-                    "volume": int(v) if v is not None else None,
-                    "oi": int(oi) if oi is not None else None,
-                }
-            )
-
-    db.release_db_connection(conn)
-    return jsonify(
-        {
-            "exchange": exchange,
-            "symbol": chosen_symbol,
-            "start": start_date.isoformat(),
-            "end": end_date.isoformat(),
-            "bars": bars,
-        }
-    )
+    return ojson(_bars_payload(exchange, symbol, start_date, end_date, limit))
 
 
-@app.route("/api/trade_logs")
-def api_trade_logs() -> Response:
+def _trade_logs_payload(
+    exchange: str, symbol: str, outcome: str, start_date: date, end_date: date
+) -> Dict[str, Any]:
     """
-    Return trade data from views only (no paper_trading_metrics):
+    api_trade_logs document, from views only (no paper_trading_metrics):
     - daily_pnl_report_view: daily summary (trade_date, exchange, reason, pnl, trades)
     - paper_trades_signal_changes_view: BUY/SELL signal changes for chart markers
     """
-    exchange = (request.args.get("exchange") or "").upper().strip()
-    symbol = (
-        request.args.get("symbol") or ""
-    ).strip()  # signal_changes view has no symbol; kept for API compat
-    outcome = (request.args.get("outcome") or "all").strip().lower()
-    today = datetime.utcnow().date()
-    default_start = today - timedelta(days=5)
-    start_date = _parse_date(request.args.get("start", ""), default_start)
-    end_date = _parse_date(request.args.get("end", ""), today)
-
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-
-    conn = db.get_db_connection()
-    cur = conn.cursor()
+    start_dt = datetime.combine(start_date, _MIDNIGHT)
+    end_dt = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
 
     # 1) Daily summary from daily_pnl_report_view
     daily_summary: List[Dict[str, Any]] = []
@@ -257,81 +442,121 @@ def api_trade_logs() -> Response:
         view_query += " AND exchange = %s"
         view_params.append(exchange)
     view_query += " ORDER BY trade_date, exchange, reason"
-    try:
-        cur.execute(view_query, view_params)
-        for row in cur.fetchall():
-            daily_summary.append(
-                {
-                    "trade_date": row[0].isoformat()
-                    if hasattr(row[0], "isoformat")
-                    else str(row[0]),
-                    "exchange": row[1],
-                    "reason": row[2],
-                    "pnl": float(row[3]) if row[3] is not None else None,
-                    "trades": int(row[4]) if row[4] is not None else 0,
-                }
-            )
-    except Exception:
-        pass
 
     # 2) BUY/SELL signals from paper_trades_signal_changes_view (view only; no paper_trading_metrics)
-    trades: List[Dict[str, Any]] = []
-    signal_query = """
-        SELECT timestamp, exchange, signal, pnl, reason
+    # Side normalization and the BUY/SELL + outcome filters run in SQL, as
+    # str(signal or "BUY").upper().strip(): a NULL or empty signal counts as BUY, while a
+    # whitespace-only one trims to '' and is dropped
+    side_sql = "upper(btrim(COALESCE(NULLIF(signal::text, ''), 'BUY')))"
+    signal_query = f"""
+        SELECT timestamp, exchange, {side_sql} AS side, pnl::float8, NULLIF(reason::text, '')
         FROM paper_trades_signal_changes_view
         WHERE timestamp >= %s AND timestamp < %s
+          AND {side_sql} IN ('BUY', 'SELL')
     """
     signal_params = [start_dt, end_dt]
     if exchange:
         signal_query += " AND exchange = %s"
         signal_params.append(exchange)
+    if outcome == "profit":
+        signal_query += " AND pnl > 0"
+    elif outcome == "loss":
+        signal_query += " AND pnl < 0"
     signal_query += " ORDER BY timestamp"
-    try:
-        cur.execute(signal_query, signal_params)
-        for ts, ex, signal, pnl_val, reason in cur.fetchall():
-            side = str(signal or "BUY").upper().strip()
-            if side not in ("BUY", "SELL"):
-                continue
-            try:
-                pnl_float = float(pnl_val) if pnl_val is not None else None
-            except Exception:
-                pnl_float = None
-            if outcome == "profit" and not (pnl_float is not None and pnl_float > 0):
-                continue
-            if outcome == "loss" and not (pnl_float is not None and pnl_float < 0):
-                continue
-            t_epoch = _to_utc_epoch_seconds(ts)
-            trades.append(
-                {
-                    "symbol": None,
-                    "exchange": ex,
-                    "side": side,
-                    "entry_time": t_epoch,
-                    "exit_time": None,
-                    "entry_price": None,
-                    "exit_price": None,
-                    "pnl": pnl_float,
-                    "exit_reason": str(reason) if reason else None,
-                }
-            )
-    except Exception:
-        pass
-
-    db.release_db_connection(conn)
 
-    return jsonify(
+    # Read-only connections run in autocommit, so a failing view query does not abort the other
+    with db.db_cursor() as cur:
+        try:
+            cur.execute(view_query, view_params)
+            for row in cur.fetchall():
+                daily_summary.append(
+                    {
+                        "trade_date": row[0].isoformat()
+                        if hasattr(row[0], "isoformat")
+                        else str(row[0]),
+                        "exchange": row[1],
+                        "reason": row[2],
+                        "pnl": float(row[3]) if row[3] is not None else None,
+                        "trades": int(row[4]) if row[4] is not None else 0,
+                    }
+                )
+        except Exception:
+            pass
+
+        try:
+            cur.execute(signal_query, signal_params)
+            signal_rows = cur.fetchall()
+        except Exception:
+            signal_rows = []
+
+    trades = [
         {
-            "exchange": exchange or None,
-            "symbol": symbol or None,
-            "start": start_date.isoformat(),
-            "end": end_date.isoformat(),
-            "daily_summary": daily_summary,
-            "trades": trades,
+            "symbol": None,
+            "exchange": ex,
+            "side": side,
+            "entry_time": _to_utc_epoch_seconds(ts),
+            "exit_time": None,
+            "entry_price": None,
+            "exit_price": None,
+            "pnl": pnl,
+            "exit_reason": reason,
         }
+        for ts, ex, side, pnl, reason in signal_rows
+    ]
+
+    return {
+        "exchange": exchange or None,
+        "symbol": symbol or None,
+        "start": start_date.isoformat(),
+        "end": end_date.isoformat(),
+        "daily_summary": daily_summary,
+        "trades": trades,
+    }
+
+
+@app.route("/api/trade_logs")
+@cached_json
+def api_trade_logs() -> Response:
+    """Return daily PnL summary and BUY/SELL signal markers (see _trade_logs_payload)."""
+    exchange = (request.args.get("exchange") or "").upper().strip()
+    symbol = (
+        request.args.get("symbol") or ""
+    ).strip()  # signal_changes view has no symbol; kept for API compat
+    outcome = (request.args.get("outcome") or "all").strip().lower()
+    today = datetime.utcnow().date()
+    default_start = today - timedelta(days=5)
+    start_date = _parse_date(request.args.get("start", ""), default_start)
+    end_date = _parse_date(request.args.get("end", ""), today)
+    return ojson(_trade_logs_payload(exchange, symbol, outcome, start_date, end_date))
+
+
+@app.route("/api/dashboard")
+@cached_json
+def api_dashboard() -> Response:
+    """
+    Return the bars_1m, trade_logs and itm_oi_volume documents for one page load, as
+    {"bars": ..., "trades": ..., "oi_vol": ...}. The three lookups run concurrently, each
+    on its own pooled connection.
+    """
+    exchange = request.args.get("exchange", "NSE").upper()
+    symbol = (request.args.get("symbol") or "").strip()
+    outcome = (request.args.get("outcome") or "all").strip().lower()
+    today = datetime.utcnow().date()
+    default_start = today - timedelta(days=5)
+    start_date = _parse_date(request.args.get("start", ""), default_start)
+    end_date = _parse_date(request.args.get("end", ""), today)
+    limit = _parse_int(request.args.get("limit", ""), 5000)
+
+    bars = _dashboard_executor.submit(_bars_payload, exchange, symbol, start_date, end_date, limit)
+    trades = _dashboard_executor.submit(
+        _trade_logs_payload, exchange, symbol, outcome, start_date, end_date
     )
+    oi_vol = _dashboard_executor.submit(_oi_vol_payload, exchange, start_date, end_date)
+    return ojson({"bars": bars.result(), "trades": trades.result(), "oi_vol": oi_vol.result()})
 
 
 @app.route("/api/paper_trading_signals")
+@cached_json
 def api_paper_trading_signals() -> Response:
     """Return BUY/SELL signals from paper_trades_signal_changes_view (view only)."""
     exchange = (request.args.get("exchange") or "").upper().strip()
@@ -340,16 +565,20 @@ def api_paper_trading_signals() -> Response:
     start_date = _parse_date(request.args.get("start", ""), default_start)
     end_date = _parse_date(request.args.get("end", ""), today)
 
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-
-    conn = db.get_db_connection()
-    cur = conn.cursor()
+    start_dt = datetime.combine(start_date, _MIDNIGHT)
+    end_dt = datetime.combine(end_date + timedelta(days=1), _MIDNIGHT)
 
-    query = """
-        SELECT timestamp, exchange, signal, executed, confidence, reason
+    signal_sql = "upper(btrim(signal::text))"
+    query = f"""
+        SELECT
+            timestamp,
+            {signal_sql},
+            COALESCE(executed::boolean, false),
+            confidence::float8,
+            NULLIF(reason::text, '')
         FROM paper_trades_signal_changes_view
         WHERE timestamp >= %s AND timestamp < %s
+          AND {signal_sql} IN ('BUY', 'SELL')
     """
     params = [start_dt, end_dt]
     if exchange:
@@ -357,27 +586,23 @@ def api_paper_trading_signals() -> Response:
         params.append(exchange)
     query += " ORDER BY timestamp"
 
-    cur.execute(query, params)
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
-
-    signals: List[Dict[str, Any]] = []
-    for ts, ex, signal, executed, confidence, reason in rows:
-        signal_str = str(signal or "").upper().strip()
-        if signal_str not in ("BUY", "SELL"):
-            continue
-        signals.append(
-            {
-                "time": _to_utc_epoch_seconds(ts),
-                "signal": signal_str,
-                "executed": bool(executed) if executed is not None else False,
-                "confidence": float(confidence) if confidence is not None else None,
-                "reason": str(reason) if reason else None,
-                "symbol": None,
-            }
-        )
+    with db.db_cursor() as cur:
+        cur.execute(query, params)
+        rows = cur.fetchall()
 
-    return jsonify(
+    signals = [
+        {
+            "time": _to_utc_epoch_seconds(ts),
+            "signal": signal,
+            "executed": executed,
+            "confidence": confidence,
+            "reason": reason,
+            "symbol": None,
+        }
+        for ts, signal, executed, confidence, reason in rows
+    ]
+
+    return ojson(
         {
             "exchange": exchange or None,
             "start": start_date.isoformat(),
@@ -388,6 +613,7 @@ def api_paper_trading_signals() -> Response:
 
 
 @app.route("/api/symbols")
+@cached_json
 def api_symbols() -> Response:
     """Return list of available symbols from multi_resolution_bars."""
     exchange = request.args.get("exchange", "NSE").upper()
@@ -396,33 +622,12 @@ def api_symbols() -> Response:
     start_date = _parse_date(request.args.get("start", ""), default_start)
     end_date = _parse_date(request.args.get("end", ""), today)
 
-    start_dt = datetime.combine(start_date, datetime.min.time())
-    end_dt = datetime.combine(end_date + timedelta(days=1), datetime.min.time())
-    res_variants = ("1m", "1", "1min", "minute", "MINUTE", "ONE_MINUTE")
-
-    conn = db.get_db_connection()
-    cur = conn.cursor()
-
-    cur.execute(
-        """
-        SELECT DISTINCT symbol, COUNT(*) AS bar_count
-        FROM multi_resolution_bars
-        WHERE exchange = %s
-          AND timestamp >= %s
-          AND timestamp < %s
-          AND resolution = ANY(%s)
-          AND symbol IS NOT NULL
-        GROUP BY symbol
-        ORDER BY bar_count DESC, symbol ASC
-        LIMIT 100
-        """,
-        (exchange, start_dt, end_dt, list(res_variants)),
-    )
-    rows = cur.fetchall()
-    db.release_db_connection(conn)
+    with db.db_cursor() as cur:
+        _execute_symbol_counts(cur, "symbols", exchange, start_date, end_date)
+        rows = cur.fetchall()
 
     symbols = [{"symbol": row[0], "bar_count": row[1]} for row in rows]
-    return jsonify(
+    return ojson(
         {
             "exchange": exchange,
             "start": start_date.isoformat(),
@@ -432,10 +637,8 @@ def api_symbols() -> Response:
     )
 
 
-@app.route("/")
-def index() -> str:
-    """Serve a single-page dashboard using TradingView Lightweight Charts."""
-    html = """
+# Single-page dashboard served by index(); encoded and hashed once at import
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
   <head>
@@ -458,6 +661,7 @@ def index() -> str:
       a { color: #60a5fa; }
     </style>
     <script src="https://unpkg.com/lightweight-charts@4.1.1/dist/lightweight-charts.standalone.production.js"></script>
+    <script src="https://unpkg.com/@msgpack/msgpack@2.8.0/dist.es5+umd/msgpack.min.js"></script>
   </head>
   <body>
     <div class="container">
@@ -505,6 +709,18 @@ def index() -> str:
 
       let oiVolumePoints = [];
 
+      // Ask for MessagePack when the decoder loaded; the server answers JSON if it cannot
+      const useMsgpack = typeof MessagePack !== 'undefined';
+      function fetchApi(url) {
+        return fetch(url, useMsgpack ? { headers: { Accept: 'application/msgpack' } } : {});
+      }
+      async function readApi(resp) {
+        if ((resp.headers.get('Content-Type') || '').includes('application/msgpack')) {
+          return MessagePack.decode(new Uint8Array(await resp.arrayBuffer()));
+        }
+        return resp.json();
+      }
+
       async function loadSymbols() {
         const ex = exchangeSelect.value || 'NSE';
         const start = startInput.value;
@@ -512,9 +728,9 @@ def index() -> str:
         if (!start || !end) return;
         try {
           const params = new URLSearchParams({ exchange: ex, start, end });
-          const resp = await fetch('/api/symbols?' + params.toString());
+          const resp = await fetchApi('/api/symbols?' + params.toString());
           if (!resp.ok) return;
-          const data = await resp.json();
+          const data = await readApi(resp);
           const symbols = data.symbols || [];
           symbolSelect.innerHTML = '<option value="">(Auto-select)</option>';
           for (const s of symbols) {
@@ -588,14 +804,29 @@ def index() -> str:
         const num = Number(v);
         return !isFinite(num) ? '--' : num.toFixed(2);
       }
+      // Columnar payload {time: [...], field: [...], ...} -> [{time, field, ...}, ...]
+      function zipColumns(cols) {
+        const names = Object.keys(cols || {});
+        const n = names.length ? cols[names[0]].length : 0;
+        const rows = new Array(n);
+        for (let i = 0; i < n; i++) {
+          const row = {};
+          for (const name of names) row[name] = cols[name][i];
+          rows[i] = row;
+        }
+        return rows;
+      }
+      // oiVolumePoints is sorted by time (the API orders by timestamp): binary search
       function findNearestOiVolPoint(time) {
         if (!oiVolumePoints.length || time == null) return null;
-        let best = null, bestDiff = Infinity;
-        for (const p of oiVolumePoints) {
-          const diff = Math.abs(p.time - time);
-          if (diff < bestDiff) { bestDiff = diff; best = p; }
+        const arr = oiVolumePoints;
+        let lo = 0, hi = arr.length - 1;
+        while (lo < hi) {
+          const mid = (lo + hi) >> 1;
+          if (arr[mid].time < time) lo = mid + 1; else hi = mid;
         }
-        return best;
+        const a = arr[lo], b = arr[Math.max(0, lo - 1)];
+        return Math.abs(b.time - time) <= Math.abs(a.time - time) ? b : a;
       }
 
       async function loadData() {
@@ -609,13 +840,16 @@ def index() -> str:
         setStatus('Loading...');
         let candleCount = 0;
         try {
+          // One request returns bars, trades and OI/Vol (queried concurrently server-side)
+          const params = new URLSearchParams({ exchange: ex, start, end, outcome: tradeFilter });
+          if (sym) params.set('symbol', sym);
+          const resp = await fetchApi('/api/dashboard?' + params.toString());
+          if (!resp.ok) throw new Error('HTTP ' + resp.status);
+          const payload = await readApi(resp);
+
           {
-            const params = new URLSearchParams({ exchange: ex, start, end });
-            if (sym) params.set('symbol', sym);
-            const resp = await fetch('/api/bars_1m?' + params.toString());
-            if (!resp.ok) throw new Error('Bars HTTP ' + resp.status);
-            const data = await resp.json();
-            const bars = data.bars || [];
+            const data = payload.bars;
+            const bars = zipColumns(data.bars);
             const candleData = bars
               .filter(b => b.open != null && b.high != null && b.low != null && b.close != null)
               .map(b => ({ time: b.time, open: b.open, high: b.high, low: b.low, close: b.close }));
@@ -627,41 +861,32 @@ def index() -> str:
           const markers = [];
           let tradeCount = 0;
           {
-            const params = new URLSearchParams({ start, end });
-            if (ex) params.set('exchange', ex);
-            params.set('outcome', tradeFilter);
-            const resp = await fetch('/api/trade_logs?' + params.toString());
-            if (resp.ok) {
-              const data = await resp.json();
-              const trades = data.trades || [];
-              tradeCount = trades.length;
-              for (const t of trades) {
-                if (t.entry_time) {
-                  markers.push({
-                    time: t.entry_time, position: t.side === 'SELL' ? 'aboveBar' : 'belowBar',
-                    color: t.side === 'SELL' ? '#f97316' : '#22c55e',
-                    shape: t.side === 'SELL' ? 'arrowDown' : 'arrowUp',
-                    text: (t.side === 'BUY' ? 'B ' : 'S ') + (t.symbol || '').slice(-12),
-                  });
-                }
-                if (t.exit_time) {
-                  markers.push({
-                    time: t.exit_time, position: 'aboveBar',
-                    color: (t.pnl != null && t.pnl < 0) ? '#ef4444' : '#22c55e',
-                    shape: 'circle',
-                    text: 'X ' + (t.pnl != null ? (t.pnl > 0 ? '+' : '') + t.pnl.toFixed(0) : ''),
-                  });
-                }
+            const data = payload.trades;
+            const trades = data.trades || [];
+            tradeCount = trades.length;
+            for (const t of trades) {
+              if (t.entry_time) {
+                markers.push({
+                  time: t.entry_time, position: t.side === 'SELL' ? 'aboveBar' : 'belowBar',
+                  color: t.side === 'SELL' ? '#f97316' : '#22c55e',
+                  shape: t.side === 'SELL' ? 'arrowDown' : 'arrowUp',
+                  text: (t.side === 'BUY' ? 'B ' : 'S ') + (t.symbol || '').slice(-12),
+                });
+              }
+              if (t.exit_time) {
+                markers.push({
+                  time: t.exit_time, position: 'aboveBar',
+                  color: (t.pnl != null && t.pnl < 0) ? '#ef4444' : '#22c55e',
+                  shape: 'circle',
+                  text: 'X ' + (t.pnl != null ? (t.pnl > 0 ? '+' : '') + t.pnl.toFixed(0) : ''),
+                });
               }
             }
           }
           candleSeries.setMarkers(markers);
 
-          const params = new URLSearchParams({ exchange: ex, start, end });
-          const resp = await fetch('/api/itm_oi_volume?' + params.toString());
-          if (!resp.ok) throw new Error('HTTP ' + resp.status);
-          const data = await resp.json();
-          const points = data.points || [];
+          const data = payload.oi_vol;
+          const points = zipColumns(data.points);
           oiVolumePoints = points;
           if (!points.length) {
             ceOiSeries.setData([]); peOiSeries.setData([]);
@@ -709,8 +934,27 @@ def index() -> str:
     </script>
   </body>
 </html>
-    """
-    return html
+"""
+_INDEX_BYTES = INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES).hexdigest()
+# Compressed once at import; served as-is to clients that accept gzip (own ETag per encoding)
+_INDEX_GZ = gzip.compress(_INDEX_BYTES, 9)
+_INDEX_GZ_ETAG = _INDEX_ETAG + "-gz"
+
+
+@app.route("/")
+def index() -> Response:
+    """Serve a single-page dashboard using TradingView Lightweight Charts."""
+    headers = {"Cache-Control": "public, max-age=300", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        resp = Response(_INDEX_GZ, mimetype="text/html", headers=headers)
+        resp.set_etag(_INDEX_GZ_ETAG)
+    else:
+        resp = Response(_INDEX_BYTES, mimetype="text/html", headers=headers)
+        resp.set_etag(_INDEX_ETAG)
+    # 304 Not Modified when the browser already holds this version
+    return resp.make_conditional(request)
 
 
 if __name__ == "__main__":